@@ -118,6 +118,7 @@ LOCAL_APPS = [
     "hr_payroll.leaves",
     "hr_payroll.notifications",
     "hr_payroll.efficiency",
+    "hr_payroll.realtime",
     # Your stuff: custom apps go here
 ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
@@ -318,6 +319,14 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Socket.IO
+# ------------------------------------------------------------------------------
+# Redis URL used as the Socket.IO message queue (python-socketio
+# AsyncRedisManager in the ASGI server, a write-only RedisManager elsewhere).
+# Required when running more than one ASGI worker or when emitting from Celery
+# or management commands; leave empty to keep rooms in process memory.
+SOCKETIO_MESSAGE_QUEUE = env("SOCKETIO_MESSAGE_QUEUE", default="")
+
 # Celery
 # ------------------------------------------------------------------------------
 if USE_TZ:
@@ -424,6 +433,9 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
+    # Symmetric signing keeps verify/refresh to one HMAC-SHA256 with SECRET_KEY
+    # (simplejwt's process-wide token backend already holds the key).
+    "ALGORITHM": "HS256",
 }
 
 # dj-rest-auth cookie-based JWT (HttpOnly cookies for browsers)
@@ -4,6 +4,7 @@ With these settings, tests run faster.
 
 from .base import *  # noqa: F403
 from .base import DATABASES
+from .base import REST_FRAMEWORK
 from .base import TEMPLATES
 from .base import env
 
@@ -38,10 +39,25 @@ MEDIA_URL = "http://media.testserver/"
 # django-webpack-loader
 # ------------------------------------------------------------------------------
 WEBPACK_LOADER["DEFAULT"]["LOADER_CLASS"] = "webpack_loader.loaders.FakeWebpackLoader"  # noqa: F405
+# DJANGO REST FRAMEWORK
+# ------------------------------------------------------------------------------
+# Tests read response.data only; never render the browsable API templates.
+REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = ("rest_framework.renderers.JSONRenderer",)
 # Your stuff...
 # ------------------------------------------------------------------------------
 
-# Force Postgres test DB to use template0 to avoid collation
-# version mismatch in containerized environments
-DATABASES["default"].setdefault("TEST", {})
-DATABASES["default"]["TEST"]["TEMPLATE"] = "template0"
+# DATABASES
+# ------------------------------------------------------------------------------
+if env.bool("PYTEST_FAST", default=False):
+    # Opt-in local shortcut: an in-memory SQLite database has no files to
+    # create or fsync. CI and the default run keep Postgres for parity.
+    DATABASES["default"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "ATOMIC_REQUESTS": True,
+    }
+else:
+    # Force Postgres test DB to use template0 to avoid collation
+    # version mismatch in containerized environments
+    DATABASES["default"].setdefault("TEST", {})
+    DATABASES["default"]["TEST"]["TEMPLATE"] = "template0"
@@ -49,8 +49,19 @@ from hr_payroll.employees.models import Employee
 from hr_payroll.org.models import Department
 from hr_payroll.policies import attendance_edit_window_days
 from hr_payroll.policies import get_policy_document
+from hr_payroll.users.api.permissions import get_group_names
+from hr_payroll.users.api.permissions import is_manager_or_admin
 
 MIN_SELF_CLOCK_OUT_HOURS = 0
+# Columns read by `EmployeeAttendanceViewSet._attendance_payload`.
+ATTENDANCE_PAYLOAD_FIELDS = (
+    "clock_in",
+    "clock_in_location",
+    "clock_out",
+    "clock_out_location",
+    "status",
+    "notes",
+)
 _EXCLUDED_DOCKER_SUBNETS = []
 for _cidr in getattr(
     settings,
@@ -444,11 +455,8 @@ class AttendanceViewSet(
             return Response(self.get_serializer(inst).data, status=200)
 
         u = request.user
-        groups = getattr(u, "groups", None)
-        is_hr = bool(getattr(u, "is_staff", False)) or bool(
-            groups and groups.filter(name__in=["Admin", "Manager"]).exists()
-        )
-        is_line_manager = bool(groups and groups.filter(name="Line Manager").exists())
+        is_hr = bool(getattr(u, "is_staff", False)) or is_manager_or_admin(u)
+        is_line_manager = ROLE_LINE_MANAGER in get_group_names(u)
         if not (is_hr or is_line_manager):
             if getattr(getattr(u, "employee", None), "id", None) != getattr(
                 inst, "employee_id", None
@@ -1520,9 +1528,11 @@ class EmployeeAttendanceViewSet(
         target_emp, error = self._resolve_self_employee_scope(request, employee_id)
         if error:
             return error
-        attendance = Attendance.objects.filter(
-            employee=target_emp, date=target_date
-        ).first()
+        attendance = (
+            Attendance.objects.filter(employee=target_emp, date=target_date)
+            .only(*ATTENDANCE_PAYLOAD_FIELDS)
+            .first()
+        )
         # If HR cleared clock_in (and possibly clock_out), treat the day as not
         # started yet so clients can clock-in again.
         if attendance is not None and attendance.clock_in is None:
@@ -2006,10 +2016,7 @@ class EmployeeAttendanceViewSet(
         status_param = request.query_params.get("status")
         office = request.query_params.get("office")
 
-        is_hr = getattr(u, "is_staff", False) or (
-            getattr(u, "groups", None)
-            and u.groups.filter(name__in=["Admin", "Manager"]).exists()
-        )
+        is_hr = getattr(u, "is_staff", False) or is_manager_or_admin(u)
         emp_ids = []
         if is_hr:
             qs_emp = Employee.objects.all()
@@ -6,6 +6,8 @@ from typing import Any
 from rest_framework.permissions import SAFE_METHODS
 from rest_framework.permissions import BasePermission
 
+from hr_payroll.users.api.permissions import get_group_names
+
 ROLE_ADMIN = "Admin"
 ROLE_MANAGER = "Manager"
 ROLE_PAYROLL = "Payroll"
@@ -17,14 +19,14 @@ def _has_employee_profile(user) -> bool:
 
 
 def _user_in_groups(user, names: Iterable[str]) -> bool:
-    groups = getattr(user, "groups", None)
     names_list = list(names)
-    if not groups or not names_list:
+    if getattr(user, "groups", None) is None or not names_list:
         return False
     # Require an employee profile for role-based access
     if not _has_employee_profile(user):
         return False
-    return groups.filter(name__in=names_list).exists()
+    # Memoized per request user, so repeated role checks share one query.
+    return not get_group_names(user).isdisjoint(names_list)
 
 
 def _is_staff_or_role(user, roles: Iterable[str]) -> bool:
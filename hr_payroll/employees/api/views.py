@@ -78,7 +78,12 @@ logger = logging.getLogger(__name__)
     retrieve=extend_schema(tags=["Employees"]),
 )
 class EmployeeRegistrationViewSet(viewsets.ModelViewSet):
-    queryset = Employee.objects.all().select_related("user", "department")
+    # EmployeeReadSerializer.get_general reads user.profile for every row.
+    queryset = Employee.objects.all().select_related(
+        "user",
+        "user__profile",
+        "department",
+    )
     serializer_class = EmployeeReadSerializer
     permission_classes = [IsAuthenticated, IsSelfEmployeeOrElevated]
     parser_classes = (JSONParser, MultiPartParser, FormParser)
@@ -17,6 +17,7 @@ from hr_payroll.org.models import Department
 from hr_payroll.org.models import OrganizationPolicy
 from hr_payroll.policies import get_policy_document
 from hr_payroll.users.api.permissions import IsManagerOrAdmin
+from hr_payroll.users.api.permissions import get_group_names
 
 from .serializers import DepartmentSerializer
 
@@ -250,9 +251,8 @@ def _can_write_org_policies(user) -> bool:
         return False
     if getattr(user, "is_staff", False) or getattr(user, "is_superuser", False):
         return True
-    names = set(user.groups.values_list("name", flat=True))
     # Frontend has HR Manager and Payroll Officer flows that both expect updates.
-    return bool(names.intersection({"Admin", "Manager", "Payroll"}))
+    return not get_group_names(user).isdisjoint({"Admin", "Manager", "Payroll"})
 
 
 @extend_schema(tags=["Organization • Policies"])
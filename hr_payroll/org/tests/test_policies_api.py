@@ -1,9 +1,12 @@
+from decimal import Decimal
+
 import pytest
 from django.contrib.auth.models import Group
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from hr_payroll.org.models import OrganizationPolicy
+from hr_payroll.policies import get_resolved_policy
 from hr_payroll.users.tests.factories import UserFactory
 
 
@@ -149,3 +152,23 @@ def test_org_policies_put_full_document_manager_updates_and_merges_defaults():
     assert body["general"]["companyName"] == "Acme"
     # Other default keys should still exist.
     assert "effectiveDate" in body["general"]
+
+
+@pytest.mark.django_db
+def test_resolved_policy_tracks_stored_document():
+    resolved = get_resolved_policy(org_id=1)
+    assert resolved.overtime_rate == Decimal("1.5")
+    assert resolved.weekly_off == frozenset({5, 6})
+
+    OrganizationPolicy.objects.create(
+        org_id=1,
+        document={
+            "overtimePolicy": {"overtimeRate": 1.75},
+            "shiftPolicy": {"weeklyOff": ["Sun"]},
+        },
+    )
+
+    resolved = get_resolved_policy(org_id=1)
+    assert resolved.overtime_rate == Decimal("1.75")
+    assert resolved.weekend_rate == Decimal(2)
+    assert resolved.weekly_off == frozenset({6})
@@ -13,12 +13,16 @@ from .accessors import standard_work_hours_per_day
 from .accessors import weekend_overtime_rate_multiplier
 from .accessors import weekly_off_weekday_indexes
 from .defaults import get_default_policy_document
+from .service import ResolvedPolicy
 from .service import get_policy_document
+from .service import get_resolved_policy
 
 __all__ = [
+    "ResolvedPolicy",
     "attendance_edit_window_days",
     "get_default_policy_document",
     "get_policy_document",
+    "get_resolved_policy",
     "holiday_overtime_rate_multiplier",
     "min_overtime_minutes",
     "overtime_rate_multiplier",
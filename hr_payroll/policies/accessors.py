@@ -1,20 +1,13 @@
 from __future__ import annotations
 
-from decimal import Decimal
+from typing import TYPE_CHECKING
 
 from django.conf import settings
 
-from .service import get_policy_document
+from .service import get_resolved_policy
 
-_DAY_TO_WEEKDAY_INDEX = {
-    "Mon": 0,
-    "Tue": 1,
-    "Wed": 2,
-    "Thu": 3,
-    "Fri": 4,
-    "Sat": 5,
-    "Sun": 6,
-}
+if TYPE_CHECKING:
+    from decimal import Decimal
 
 
 def attendance_edit_window_days() -> int:
@@ -35,55 +28,31 @@ def overtime_rate_multiplier() -> Decimal:
     Source of truth is the policy document (mirrors frontend `overtimePolicy`).
     """
 
-    doc = get_policy_document()
-    rate = doc.get("overtimePolicy", {}).get("overtimeRate", 1.5)
-    return Decimal(str(rate))
+    return get_resolved_policy().overtime_rate
 
 
 def weekend_overtime_rate_multiplier() -> Decimal:
     """Weekend overtime multiplier (default: 2)."""
 
-    doc = get_policy_document()
-    rate = doc.get("overtimePolicy", {}).get("weekendRate", 2)
-    return Decimal(str(rate))
+    return get_resolved_policy().weekend_rate
 
 
 def holiday_overtime_rate_multiplier() -> Decimal:
     """Holiday overtime multiplier (default: 2)."""
 
-    doc = get_policy_document()
-    rate = doc.get("overtimePolicy", {}).get("holidayRate", 2)
-    return Decimal(str(rate))
+    return get_resolved_policy().holiday_rate
 
 
 def min_overtime_minutes() -> int:
     """Minimum overtime minutes before overtime pay applies (default: 30)."""
 
-    doc = get_policy_document()
-    minutes = doc.get("overtimePolicy", {}).get("minOvertimeMinutes", 30)
-    try:
-        return int(minutes)
-    except (TypeError, ValueError):
-        return 30
+    return get_resolved_policy().min_overtime_minutes
 
 
-def weekly_off_weekday_indexes() -> set[int]:
+def weekly_off_weekday_indexes() -> frozenset[int]:
     """Return the weekly off days as weekday indexes (Mon=0 ... Sun=6).
 
     Defaults to Saturday/Sunday to match the frontend defaults.
     """
 
-    doc = get_policy_document()
-    weekly_off = doc.get("shiftPolicy", {}).get("weeklyOff", ["Sat", "Sun"])
-    if not isinstance(weekly_off, list):
-        weekly_off = ["Sat", "Sun"]
-
-    indexes: set[int] = set()
-    for item in weekly_off:
-        if not isinstance(item, str):
-            continue
-        idx = _DAY_TO_WEEKDAY_INDEX.get(item)
-        if idx is not None:
-            indexes.add(idx)
-
-    return indexes or {5, 6}
+    return get_resolved_policy().weekly_off
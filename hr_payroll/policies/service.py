@@ -1,37 +1,162 @@
 from __future__ import annotations
 
-import copy
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING
 from typing import Any
 
 from hr_payroll.org.models import OrganizationPolicy
 from hr_payroll.policies.defaults import get_default_policy_document
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
+# Index in this tuple is the weekday index (Mon=0 ... Sun=6).
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_DEFAULT_WEEKLY_OFF = frozenset({5, 6})
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class ResolvedPolicy:
+    """Typed values derived from a policy document.
+
+    Built once per policy revision so accessors don't re-walk the document or
+    rebuild Decimals/sets on every call.
+    """
+
+    overtime_rate: Decimal
+    weekend_rate: Decimal
+    holiday_rate: Decimal
+    min_overtime_minutes: int
+    weekly_off: frozenset[int]
+
+
+# org_id -> (OrganizationPolicy.updated_at or None, value); see `_policy_revision`.
+_document_cache: dict[int, tuple[datetime | None, dict[str, Any]]] = {}
+_resolved_cache: dict[int, tuple[datetime | None, ResolvedPolicy]] = {}
+
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    """Deep-merge override into base (dict-only), returning a new dict."""
+    """Deep-merge override into base (dict-only).
 
-    out: dict[str, Any] = copy.deepcopy(base)
-    for key, value in (override or {}).items():
-        if key in out and isinstance(out[key], dict) and isinstance(value, dict):
-            out[key] = _deep_merge(out[key], value)
+    Only the dicts on the path of an override are copied (shallowly); untouched
+    sub-trees and leaf values are shared by reference with `base`/`override`,
+    and `base` itself is returned when there is nothing to merge. Policy
+    documents are JSON-shaped and treated as read-only by callers.
+    """
+
+    if not override:
+        return base
+
+    out: dict[str, Any] = {**base}
+    for key, value in override.items():
+        current = out.get(key, _MISSING)
+        if current is value:
+            continue
+        if isinstance(current, dict) and isinstance(value, dict):
+            out[key] = _deep_merge(current, value)
         else:
             out[key] = value
     return out
 
 
+def _policy_revision(org_id: int) -> datetime | None:
+    """Cheap change marker for `org_id`'s stored policy (None when no row).
+
+    Relies on `updated_at` (auto_now), so policy writes must go through
+    `save()`/`update_or_create()` rather than `QuerySet.update()`.
+    """
+
+    return (
+        OrganizationPolicy.objects.filter(org_id=org_id)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+
+
+def _load_policy_document(org_id: int) -> tuple[datetime | None, dict[str, Any]]:
+    defaults = get_default_policy_document()
+
+    row = OrganizationPolicy.objects.filter(org_id=org_id).first()
+    if not row:
+        return None, defaults
+    if not isinstance(row.document, dict):
+        return row.updated_at, defaults
+
+    return row.updated_at, _deep_merge(defaults, row.document)
+
+
+def _cached_policy_document(org_id: int, revision: datetime | None) -> dict[str, Any]:
+    cached = _document_cache.get(org_id)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+
+    # Keyed on the revision of the row actually read, so a concurrent write
+    # between the two queries only causes one extra reload.
+    loaded_revision, doc = _load_policy_document(org_id)
+    _document_cache[org_id] = (loaded_revision, doc)
+    return doc
+
+
 def get_policy_document(org_id: int = 1) -> dict[str, Any]:
     """Return the organization policy document for `org_id`.
 
     - If a policy row exists, return defaults merged with the stored document.
     - Otherwise return the default policy document.
 
-    This mirrors the frontend `initialPolicies` shape.
+    This mirrors the frontend `initialPolicies` shape. The merged document is
+    cached per process and only rebuilt when the row's `updated_at` changes;
+    it is shared between callers and must be treated as read-only.
     """
 
-    defaults = get_default_policy_document()
+    return _cached_policy_document(org_id, _policy_revision(org_id))
 
-    row = OrganizationPolicy.objects.filter(org_id=org_id).first()
-    if not row or not isinstance(row.document, dict):
-        return defaults
 
-    return _deep_merge(defaults, row.document)
+def _weekly_off_indexes(weekly_off: Any) -> frozenset[int]:
+    if not isinstance(weekly_off, list) or weekly_off == ["Sat", "Sun"]:
+        return _DEFAULT_WEEKLY_OFF
+
+    indexes = frozenset(
+        _WEEKDAYS.index(item)
+        for item in weekly_off
+        if isinstance(item, str) and item in _WEEKDAYS
+    )
+    return indexes or _DEFAULT_WEEKLY_OFF
+
+
+def _resolve_policy(doc: dict[str, Any]) -> ResolvedPolicy:
+    overtime = doc.get("overtimePolicy", {})
+
+    minutes = overtime.get("minOvertimeMinutes", 30)
+    try:
+        min_minutes = int(minutes)
+    except (TypeError, ValueError):
+        min_minutes = 30
+
+    return ResolvedPolicy(
+        overtime_rate=Decimal(str(overtime.get("overtimeRate", 1.5))),
+        weekend_rate=Decimal(str(overtime.get("weekendRate", 2))),
+        holiday_rate=Decimal(str(overtime.get("holidayRate", 2))),
+        min_overtime_minutes=min_minutes,
+        weekly_off=_weekly_off_indexes(doc.get("shiftPolicy", {}).get("weeklyOff")),
+    )
+
+
+def get_resolved_policy(org_id: int = 1) -> ResolvedPolicy:
+    """Return the `ResolvedPolicy` for `org_id`, rebuilt only when it changes.
+
+    The cache is validated against the policy row's `updated_at` (a single
+    narrow query), so it stays correct across worker processes and
+    transactions without explicit invalidation.
+    """
+
+    revision = _policy_revision(org_id)
+    cached = _resolved_cache.get(org_id)
+    if cached is not None and cached[0] == revision:
+        return cached[1]
+
+    resolved = _resolve_policy(_cached_policy_document(org_id, revision))
+    _resolved_cache[org_id] = (revision, resolved)
+    return resolved
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class RealtimeConfig(AppConfig):
+    name = "hr_payroll.realtime"
+    verbose_name = _("Realtime")
+
+    def ready(self):
+        import hr_payroll.realtime.signals  # noqa: F401, PLC0415
@@ -0,0 +1,36 @@
+"""Short-lived cache of per-user realtime context.
+
+The Socket.IO `connect` handler needs the user's groups/employee/department to
+decide which rooms to join. Reconnect storms (mobile wake-ups, dev reloads)
+would otherwise repeat those lookups for every connect, so the resolved
+context is cached per user and invalidated from model signals.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+
+if TYPE_CHECKING:
+    from hr_payroll.realtime.socketio import UserRealtimeContext
+
+# Upper bound on staleness for changes no signal reports (e.g. group renames).
+USER_CONTEXT_TTL_SECONDS = 60
+
+
+def _user_context_key(user_id: int | str) -> str:
+    return f"realtime:user_context:{user_id}"
+
+
+def get_cached_user_context(user_id: int | str) -> UserRealtimeContext | None:
+    return cache.get(_user_context_key(user_id))
+
+
+def cache_user_context(ctx: UserRealtimeContext) -> None:
+    cache.set(_user_context_key(ctx.user_id), ctx, USER_CONTEXT_TTL_SECONDS)
+
+
+def invalidate_user_context(*user_ids: int | str) -> None:
+    if user_ids:
+        cache.delete_many([_user_context_key(user_id) for user_id in user_ids])
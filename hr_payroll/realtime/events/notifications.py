@@ -3,9 +3,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Any
 
+from hr_payroll.realtime.socketio import emit_event_to_user
+
 if TYPE_CHECKING:  # import for type checking only
     from hr_payroll.notifications.models import Notification
-from hr_payroll.realtime.socketio import emit_event_to_user
 
 
 def build_notification_payload(notification: Notification) -> dict[str, Any]:
@@ -0,0 +1,48 @@
+"""Invalidate cached realtime user context when its inputs change."""
+
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from hr_payroll.realtime.cache import invalidate_user_context
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_context_on_user_change(sender, instance, **kwargs):
+    # Covers deactivation: an inactive user must not reconnect from cache.
+    invalidate_user_context(instance.pk)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_context_on_groups_change(
+    sender,
+    instance,
+    action,
+    reverse,
+    pk_set,
+    **kwargs,
+):
+    if reverse and action == "pre_clear":
+        # `group.user_set.clear()` sends no pk_set; read the members first.
+        invalidate_user_context(*instance.user_set.values_list("pk", flat=True))
+        return
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate_user_context(instance.pk)
+    elif pk_set:
+        # Changed from the group side: pk_set holds the affected user ids.
+        invalidate_user_context(*pk_set)
+
+
+@receiver(post_save, sender="employees.Employee")
+@receiver(post_delete, sender="employees.Employee")
+def invalidate_context_on_employee_change(sender, instance, **kwargs):
+    invalidate_user_context(instance.user_id)
@@ -15,30 +15,57 @@ any events.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
+from functools import cache
+from functools import lru_cache
 from typing import Any
-from urllib.parse import parse_qs
+from urllib.parse import unquote_plus
 
+import orjson
 import socketio
-from asgiref.sync import async_to_sync
 from channels.db import database_sync_to_async
-from rest_framework.exceptions import AuthenticationFailed
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import TokenError
+from django.conf import settings
+
+from hr_payroll.realtime.cache import cache_user_context
+from hr_payroll.realtime.cache import get_cached_user_context
 
 logger = logging.getLogger(__name__)
 
 
+class _OrjsonCodec:
+    """`json`-module shim for python-socketio backed by orjson.
+
+    Socket.IO passes stdlib-only kwargs (e.g. `separators`); orjson always
+    emits compact output, so they are ignored.
+    """
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(data: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(data)
+
+
+def _client_manager() -> socketio.AsyncManager | None:
+    url = getattr(settings, "SOCKETIO_MESSAGE_QUEUE", "")
+    return socketio.AsyncRedisManager(url) if url else None
+
+
 sio = socketio.AsyncServer(
     async_mode="asgi",
+    client_manager=_client_manager(),
     cors_allowed_origins="*",
     logger=False,
     engineio_logger=False,
+    json=_OrjsonCodec,
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserRealtimeContext:
     user_id: int
     group_names: tuple[str, ...]
@@ -46,6 +73,8 @@ class UserRealtimeContext:
     department_id: int | None
 
 
+# Group names form a small, fixed set, so room names are memoized.
+@lru_cache(maxsize=128)
 def _normalize_room_suffix(value: str) -> str:
     return "_".join(value.strip().lower().split())
 
@@ -54,6 +83,7 @@ def room_for_user(user_id: int) -> str:
     return f"user_{int(user_id)}"
 
 
+@lru_cache(maxsize=128)
 def room_for_group(group_name: str) -> str:
     return f"group_{_normalize_room_suffix(group_name)}"
 
@@ -68,26 +98,73 @@ def room_for_employee(employee_id: int) -> str:
 
 @database_sync_to_async
 def _get_user_context_from_access_token(token: str) -> UserRealtimeContext:
+    # Imported lazily: this module is pulled in by every process that publishes
+    # notifications (Celery, management commands), most of which never connect.
+    from django.contrib.auth import get_user_model  # noqa: PLC0415
+    from rest_framework.exceptions import AuthenticationFailed  # noqa: PLC0415
+    from rest_framework_simplejwt.authentication import (  # noqa: PLC0415
+        JWTAuthentication,
+    )
+    from rest_framework_simplejwt.exceptions import InvalidToken  # noqa: PLC0415
+    from rest_framework_simplejwt.settings import (  # noqa: PLC0415
+        api_settings as jwt_settings,
+    )
+
     jwt_auth = JWTAuthentication()
     validated = jwt_auth.get_validated_token(token)
-    user = jwt_auth.get_user(validated)
 
-    groups_qs = getattr(user, "groups", None)
-    if groups_qs is None:
-        group_names: tuple[str, ...] = ()
-    else:
-        group_names = tuple(groups_qs.order_by("name").values_list("name", flat=True))
+    # The token itself is always verified; only the user lookups are cached.
+    user_id = validated.get(jwt_settings.USER_ID_CLAIM)
+    if user_id is None:
+        msg = "Token contained no recognizable user identification"
+        raise InvalidToken(msg)
+
+    cached = get_cached_user_context(user_id)
+    if cached is not None:
+        return cached
+
+    # Same checks as `JWTAuthentication.get_user`, but loading the employee
+    # (joined) and the groups (one prefetch) that the rooms are built from.
+    user = (
+        get_user_model()
+        .objects.select_related("employee")
+        .prefetch_related("groups")
+        .filter(**{jwt_settings.USER_ID_FIELD: user_id})
+        .first()
+    )
+    if user is None or not user.is_active:
+        msg = "User not found or inactive"
+        raise AuthenticationFailed(msg, code="user_not_found")
+
+    # Sorted in Python: a handful of names, only needed in a stable order.
+    group_names = tuple(sorted(group.name for group in user.groups.all()))
 
     employee = getattr(user, "employee", None)
     employee_id = getattr(employee, "id", None)
     department_id = getattr(employee, "department_id", None)
 
-    return UserRealtimeContext(
+    ctx = UserRealtimeContext(
         user_id=int(user.id),
         group_names=group_names,
         employee_id=int(employee_id) if employee_id else None,
         department_id=int(department_id) if department_id else None,
     )
+    cache_user_context(ctx)
+    return ctx
+
+
+def _find_token_in_qs(query_string: str) -> str | None:
+    """Return the first non-empty `token` value from a query string.
+
+    Equivalent to `parse_qs(qs).get("token", [None])[0]` without decoding and
+    collecting every other parameter.
+    """
+
+    for part in query_string.split("&"):
+        name, sep, value = part.partition("=")
+        if sep and value and unquote_plus(name) == "token":
+            return unquote_plus(value)
+    return None
 
 
 def _extract_token(environ: dict[str, Any], auth: Any | None) -> str | None:
@@ -111,8 +188,8 @@ def _extract_token(environ: dict[str, Any], auth: Any | None) -> str | None:
     if isinstance(query_string, (bytes, bytearray)):
         query_string = query_string.decode(errors="ignore")
 
-    token = parse_qs(str(query_string)).get("token", [None])[0]
-    if isinstance(token, str) and token:
+    token = _find_token_in_qs(str(query_string))
+    if token:
         return token
 
     # Allow `auth: { token }` as fallback.
@@ -126,6 +203,9 @@ def _extract_token(environ: dict[str, Any], auth: Any | None) -> str | None:
 
 @sio.event
 async def connect(sid: str, environ: dict[str, Any], auth: Any | None = None):
+    from rest_framework.exceptions import AuthenticationFailed  # noqa: PLC0415
+    from rest_framework_simplejwt.exceptions import TokenError  # noqa: PLC0415
+
     token = _extract_token(environ, auth)
     if not token:
         msg = "unauthorized"
@@ -152,22 +232,24 @@ async def connect(sid: str, environ: dict[str, Any], auth: Any | None = None):
         sid,
         {
             "user_id": ctx.user_id,
-            "group_names": list(ctx.group_names),
+            "group_names": ctx.group_names,
             "employee_id": ctx.employee_id,
             "department_id": ctx.department_id,
         },
     )
 
     # Always join the per-user room.
-    await sio.enter_room(sid, room_for_user(ctx.user_id))
+    rooms = {room_for_user(ctx.user_id)}
 
     # Optional rooms for future cross-domain features.
     if ctx.employee_id is not None:
-        await sio.enter_room(sid, room_for_employee(ctx.employee_id))
+        rooms.add(room_for_employee(ctx.employee_id))
     if ctx.department_id is not None:
-        await sio.enter_room(sid, room_for_department(ctx.department_id))
-    for group_name in ctx.group_names:
-        await sio.enter_room(sid, room_for_group(group_name))
+        rooms.add(room_for_department(ctx.department_id))
+    rooms.update(room_for_group(group_name) for group_name in ctx.group_names)
+
+    # Join concurrently; with a pub/sub client manager each join is a round-trip.
+    await asyncio.gather(*(sio.enter_room(sid, room) for room in rooms))
 
 
 @sio.event
@@ -196,10 +278,73 @@ async def ping_notification(sid: str, data: Any):
     await sio.emit("notification", payload, to=sid)
 
 
+# Strong references to fire-and-forget emits scheduled on a running loop.
+_pending_emits: set[asyncio.Task] = set()
+
+
+# `room` may be a list of rooms: the manager then fans out from a single emit
+# (one pub/sub message when a Redis manager is configured).
+Room = str | list[str]
+
+
+async def _emit_many(events: list[tuple[Room, str, dict[str, Any]]]) -> None:
+    await asyncio.gather(
+        *(sio.emit(event, payload, room=room) for room, event, payload in events),
+    )
+
+
+@cache
+def _emit_many_sync():
+    # Wrapped once: re-wrapping with `async_to_sync` on every emit is wasted
+    # setup. Built lazily so importing this module stays cheap.
+    from asgiref.sync import async_to_sync  # noqa: PLC0415
+
+    return async_to_sync(_emit_many)
+
+
+@cache
+def _write_only_manager() -> socketio.RedisManager | None:
+    """Synchronous publisher for emits made outside the server's event loop.
+
+    Outside ASGI (Celery, management commands) `async_to_sync` runs every call
+    on a new event loop, which the `AsyncRedisManager` above is not bound to;
+    a write-only sync manager just publishes to the queue the servers read.
+    """
+
+    url = getattr(settings, "SOCKETIO_MESSAGE_QUEUE", "")
+    return socketio.RedisManager(url, write_only=True) if url else None
+
+
+def emit_events(events: list[tuple[Room, str, dict[str, Any]]]) -> None:
+    """Emit several `(room, event, payload)` triples from sync Django code.
+
+    With a message queue configured the emits are published straight to it.
+    Otherwise they share one event-loop hop, or, when called from a thread
+    that already runs an event loop (where `async_to_sync` is not allowed),
+    are scheduled on that loop instead.
+    """
+
+    if not events:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        manager = _write_only_manager()
+        if manager is None:
+            _emit_many_sync()(events)
+            return
+        for room, event, payload in events:
+            manager.emit(event, payload, namespace="/", room=room)
+        return
+    task = loop.create_task(_emit_many(events))
+    _pending_emits.add(task)
+    task.add_done_callback(_pending_emits.discard)
+
+
 def emit_event_to_room(room: str, event: str, payload: dict[str, Any]) -> None:
     """Emit an event to a room from sync Django code."""
 
-    async_to_sync(sio.emit)(event, payload, room=room)
+    emit_events([(room, event, payload)])
 
 
 def emit_event_to_user(user_id: int, event: str, payload: dict[str, Any]) -> None:
@@ -0,0 +1,84 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from hr_payroll.realtime.cache import get_cached_user_context
+from hr_payroll.realtime.socketio import _get_user_context_from_access_token
+from hr_payroll.users.models import User
+
+# `database_sync_to_async` closes the connection around each call, which would
+# break the rolled-back transaction a plain `db` test runs in.
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+
+
+@pytest.fixture
+def group(db) -> Group:
+    return Group.objects.create(name="Realtime Testers")
+
+
+def connect_as(user: User):
+    token = str(AccessToken.for_user(user))
+    return async_to_sync(_get_user_context_from_access_token)(token)
+
+
+def test_second_connect_reads_context_from_cache(user: User, group: Group):
+    user.groups.add(group)
+    first = connect_as(user)
+    assert get_cached_user_context(user.pk) == first
+
+    with CaptureQueriesContext(connection) as ctx:
+        second = connect_as(user)
+
+    assert second == first
+    users_table = User._meta.db_table  # noqa: SLF001
+    assert not any(users_table in query["sql"] for query in ctx.captured_queries)
+
+
+def test_deactivating_user_invalidates_context(user: User):
+    connect_as(user)
+
+    user.is_active = False
+    user.save()
+
+    assert get_cached_user_context(user.pk) is None
+    with pytest.raises(AuthenticationFailed):
+        connect_as(user)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda user, group: user.groups.add(Group.objects.create(name="Other")),
+        lambda user, group: user.groups.remove(group),
+        lambda user, group: user.groups.clear(),
+        lambda user, group: Group.objects.create(name="Other").user_set.add(user),
+        lambda user, group: group.user_set.remove(user),
+        lambda user, group: group.user_set.clear(),
+    ],
+    ids=[
+        "add",
+        "remove",
+        "clear",
+        "reverse-add",
+        "reverse-remove",
+        "reverse-clear",
+    ],
+)
+def test_group_changes_invalidate_context(user: User, group: Group, change):
+    user.groups.add(group)
+    connect_as(user)
+    assert get_cached_user_context(user.pk) is not None
+
+    change(user, group)
+
+    assert get_cached_user_context(user.pk) is None
@@ -1,13 +1,37 @@
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:  # pragma: no cover - typing only
-    from datetime import timedelta
-
 from dj_rest_auth.views import LoginView
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenRefreshView
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from datetime import timedelta
+
+
+_COOKIE_SETTINGS = {"JWT_AUTH_COOKIE_SECURE", "JWT_AUTH_COOKIE_SAMESITE", "DEBUG"}
+
+
+@lru_cache(maxsize=1)
+def _cookie_defaults() -> dict[str, object]:
+    """Cookie attributes shared by the access and refresh JWT cookies."""
+
+    return {
+        "httponly": True,
+        "secure": getattr(settings, "JWT_AUTH_COOKIE_SECURE", not settings.DEBUG),
+        "samesite": getattr(settings, "JWT_AUTH_COOKIE_SAMESITE", "Lax"),
+        "path": "/",
+    }
+
+
+@receiver(setting_changed)
+def _reset_cookie_defaults(*, setting, **kwargs):
+    if setting in _COOKIE_SETTINGS:
+        _cookie_defaults.cache_clear()
+
 
 def _set_cookie(
     response: Response,
@@ -17,15 +41,10 @@ def _set_cookie(
 ) -> None:
     if not value:
         return
-    cookie_kwargs = {
-        "httponly": True,
-        "secure": getattr(settings, "JWT_AUTH_COOKIE_SECURE", not settings.DEBUG),
-        "samesite": getattr(settings, "JWT_AUTH_COOKIE_SAMESITE", "Lax"),
-        "path": "/",
-    }
-    if max_age is not None:
-        cookie_kwargs["max_age"] = max_age
-    response.set_cookie(name, value, **cookie_kwargs)
+    if max_age is None:
+        response.set_cookie(name, value, **_cookie_defaults())
+    else:
+        response.set_cookie(name, value, **_cookie_defaults(), max_age=max_age)
 
 
 def _set_jwt_cookies(
@@ -1,5 +1,37 @@
 from rest_framework.permissions import BasePermission
 
+# Roles that may manage and list every user.
+ELEVATED_ROLES = frozenset({"Admin", "Manager"})
+
+
+def get_group_names(user) -> frozenset[str]:
+    """Return the user's group names, memoized on the user instance.
+
+    DRF keeps one `request.user` object for the whole request, so permission
+    classes, querysets and views can share a single groups query. Reads through
+    `groups.all()` so a `prefetch_related("groups")` on the user is reused.
+    """
+
+    cached = user.__dict__.get("_group_names")
+    if cached is not None:
+        return cached
+    groups = getattr(user, "groups", None)
+    names: frozenset[str] = frozenset()
+    if groups is not None:
+        names = frozenset(group.name for group in groups.all())
+    user.__dict__["_group_names"] = names
+    return names
+
+
+def clear_group_names(user) -> None:
+    """Drop the memoized group names (e.g. after `user.groups` changed)."""
+
+    user.__dict__.pop("_group_names", None)
+
+
+def is_manager_or_admin(user) -> bool:
+    return not get_group_names(user).isdisjoint(ELEVATED_ROLES)
+
 
 class IsManagerOrAdmin(BasePermission):
     """Allow access only to staff or users in Admin/Manager groups."""
@@ -10,5 +42,4 @@ class IsManagerOrAdmin(BasePermission):
             return False
         if getattr(u, "is_staff", False):
             return True
-        groups = getattr(u, "groups", None)
-        return bool(groups and groups.filter(name__in=["Admin", "Manager"]).exists())
+        return is_manager_or_admin(u)
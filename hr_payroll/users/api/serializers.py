@@ -1,9 +1,11 @@
 from django.core.exceptions import ObjectDoesNotExist
-from django.urls import NoReverseMatch
-from django.urls import reverse
 from rest_framework import serializers
 
 from hr_payroll.users.models import User
+from hr_payroll.users.urls_cache import user_url
+
+# Route names tried in order; registrations differ between environments.
+_USER_DETAIL_VIEW_NAMES = ("api_v1:user-detail", "api:user-detail", "user-detail")
 
 
 class UserSerializer(serializers.ModelSerializer[User]):
@@ -13,13 +15,8 @@ class UserSerializer(serializers.ModelSerializer[User]):
         read_only=True,
         slug_field="name",
     )
-    id = serializers.IntegerField(read_only=True)
     employee_id = serializers.SerializerMethodField()
 
-    # Make username & email explicitly read-only to preserve auto-generation invariant
-    username = serializers.CharField(read_only=True)
-    email = serializers.EmailField(read_only=True)
-
     class Meta:
         model = User
         fields = [
@@ -33,53 +30,28 @@ class UserSerializer(serializers.ModelSerializer[User]):
             "groups",
             "url",
         ]
+        # username & email are read-only to preserve the auto-generation invariant
+        read_only_fields = ["id", "username", "email"]
 
     url = serializers.SerializerMethodField()
 
     def get_url(self, obj: User) -> str:
         request = self.context.get("request")
-        if request is None:
-            # Try common namespaced and non-namespaced route names
-            for candidate in (
-                "api_v1:user-detail",
-                "api:user-detail",
-                "user-detail",
-            ):
-                try:
-                    return reverse(candidate, kwargs={"username": obj.username})
-                except NoReverseMatch:
-                    continue
-            # Give up gracefully
-            return ""
-
-        namespace = getattr(
-            getattr(request, "resolver_match", None),
-            "namespace",
-            None,
+        namespace = (
+            getattr(getattr(request, "resolver_match", None), "namespace", None)
+            if request is not None
+            else None
         )
-
-        # Build a list of candidate view names to try in order of likelihood.
-        candidates = []
+        view_names = _USER_DETAIL_VIEW_NAMES
         if namespace:
-            candidates.append(f"{namespace}:user-detail")
-        candidates.extend(
-            [
-                "api_v1:user-detail",
-                "api:user-detail",
-                "user-detail",
-            ]
-        )
-
-        for view_name in candidates:
-            try:
-                url = reverse(view_name, kwargs={"username": obj.username})
-            except NoReverseMatch:
-                continue
-            return request.build_absolute_uri(url)
-
-        # If we couldn't resolve any name, return an empty string rather than raising
-        # to avoid crashing serialization in environments with different router
-        # registrations.
+            view_names = (f"{namespace}:user-detail", *view_names)
+        for view_name in view_names:
+            url = user_url(view_name, obj.username)
+            if url is not None:
+                return request.build_absolute_uri(url) if request is not None else url
+        # If we couldn't resolve any name, return an empty string rather than
+        # raising to avoid crashing serialization in environments with
+        # different router registrations.
         return ""
 
     def get_employee_id(self, obj: User) -> int | None:
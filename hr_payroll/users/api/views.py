@@ -1,3 +1,8 @@
+from functools import cached_property
+
+from django.contrib.auth.models import Group
+from django.db.models import Prefetch
+from django.db.models import prefetch_related_objects
 from drf_spectacular.utils import extend_schema
 from drf_spectacular.utils import extend_schema_view
 from rest_framework import status
@@ -11,8 +16,21 @@ from rest_framework.viewsets import GenericViewSet
 from hr_payroll.audit.utils import log_action
 from hr_payroll.users.models import User
 
+from .permissions import is_manager_or_admin
 from .serializers import UserSerializer
 
+# Columns `UserSerializer` reads when rendering; `name` backs `full_name` and
+# `username` backs `url`. Groups are prefetched and `employee` is joined.
+USER_READ_FIELDS = (
+    "id",
+    "username",
+    "first_name",
+    "last_name",
+    "name",
+    "email",
+    "employee__id",
+)
+
 
 @extend_schema_view(
     list=extend_schema(tags=["Users"]),
@@ -29,16 +47,37 @@ class UserViewSet(RetrieveModelMixin, ListModelMixin, UpdateModelMixin, GenericV
     # Keep legacy API contract: return a plain list (no pagination) for /api/v1/users/
     pagination_class = None
 
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        user = request.user
+        if getattr(user, "is_authenticated", False):
+            # One groups query serves both the role check and `me` serialization.
+            prefetch_related_objects([user], "groups")
+
     def get_queryset(self, *args, **kwargs):  # type: ignore[override]
         user = self.request.user
         if not getattr(user, "is_authenticated", False):  # pragma: no cover - safety
             return User.objects.none()
-        # Managers/Admins may list all users; others only themselves
-        is_elevated = getattr(user, "is_staff", False) or (
-            getattr(user, "groups", None)
-            and user.groups.filter(name__in=["Admin", "Manager"]).exists()
+        # Serializer renders only group names per row; load them in one query.
+        # It exposes no permissions, so `groups__permissions` is not prefetched.
+        queryset = User.objects.prefetch_related(
+            Prefetch("groups", queryset=Group.objects.only("id", "name")),
         )
-        return User.objects.all() if is_elevated else User.objects.filter(pk=user.pk)
+        if self.action in ("list", "retrieve"):
+            # Read-only actions skip password, permission flags and timestamps.
+            # Updates keep full rows so save() writes `updated_at`.
+            queryset = queryset.select_related("employee").only(*USER_READ_FIELDS)
+        return queryset if self.is_elevated else queryset.filter(pk=user.pk)
+
+    @cached_property
+    def is_elevated(self) -> bool:
+        """Managers/Admins may list all users; others only themselves.
+
+        Views are built per request, so this is evaluated once even though DRF
+        calls `get_queryset` from several places.
+        """
+        user = self.request.user
+        return bool(getattr(user, "is_staff", False) or is_manager_or_admin(user))
 
     @action(detail=False)
     def me(self, request):
@@ -1,6 +1,7 @@
 import contextlib
 
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 from django.utils.translation import gettext_lazy as _
 
 
@@ -10,4 +11,6 @@ class UsersConfig(AppConfig):
 
     def ready(self):
         with contextlib.suppress(ImportError):
-            import hr_payroll.users.signals  # noqa: F401, PLC0415
+            from hr_payroll.users.signals import seed_default_group  # noqa: PLC0415
+
+            post_migrate.connect(seed_default_group, sender=self)
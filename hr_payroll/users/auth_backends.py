@@ -1,17 +1,30 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
+from django.db.models import Case
+from django.db.models import Q
+from django.db.models import Value
+from django.db.models import When
 
 
 class UsernameOrEmailBackend(ModelBackend):
     def authenticate(self, request, username=None, password=None, **kwargs):
         usermodel = get_user_model()
-        try:
-            user = usermodel.objects.get(email__iexact=username)
-        except usermodel.DoesNotExist:
-            try:
-                user = usermodel.objects.get(username__iexact=username)
-            except usermodel.DoesNotExist:
-                return None
+        # Single query; an email match still wins over a username match.
+        user = (
+            usermodel.objects.filter(
+                Q(email__iexact=username) | Q(username__iexact=username),
+            )
+            .order_by(
+                Case(When(email__iexact=username, then=Value(0)), default=Value(1)),
+                "pk",
+            )
+            .first()
+        )
+        if user is None:
+            # Run the default hasher once, as ModelBackend does, so a miss
+            # takes as long as a wrong password (no user enumeration by timing).
+            usermodel().set_password(password)
+            return None
 
         if user.check_password(password) and self.user_can_authenticate(user):
             return user
@@ -1,11 +1,48 @@
 from __future__ import annotations
 
 import getpass
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
 
+import django
+from django.apps import apps
+from django.contrib.auth.hashers import Argon2PasswordHasher
+from django.contrib.auth.hashers import check_password
 from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
 from django.core.management.base import CommandParser
 
+ARGON2_COST_OPTIONS = ("time_cost", "memory_cost", "parallelism")
+
+
+def _init_worker() -> None:
+    """Configure Django in pool workers that were not forked from the command.
+
+    Under the spawn/forkserver start methods a worker starts a fresh
+    interpreter, and `make_password` needs the settings.
+    """
+
+    if not apps.ready:
+        django.setup()
+
+
+def _hash(pwd: str, hasher: str, argon2_costs: dict[str, int]) -> str:
+    """Hash one password; module-level so process-pool workers can pickle it."""
+
+    if argon2_costs:
+        argon2 = Argon2PasswordHasher()
+        for name, value in argon2_costs.items():
+            setattr(argon2, name, value)
+        return argon2.encode(pwd, argon2.salt())
+    # Use default hasher when 'default' selected; else use chosen algorithm
+    if hasher == "default":
+        return make_password(pwd)
+    return make_password(pwd, hasher=hasher)
+
 
 class Command(BaseCommand):
     help = "Generate a Django-compatible password hash and print it"
@@ -33,10 +70,66 @@ class Command(BaseCommand):
                 "Common options: 'argon2', 'pbkdf2_sha256'."
             ),
         )
+        parser.add_argument(
+            "--time-cost",
+            dest="time_cost",
+            type=int,
+            help=(
+                "Argon2 iterations (implies --hasher argon2). Hashes whose "
+                "parameters differ from Django's are re-hashed on next login."
+            ),
+        )
+        parser.add_argument(
+            "--memory-cost",
+            dest="memory_cost",
+            type=int,
+            help="Argon2 memory in KiB (implies --hasher argon2).",
+        )
+        parser.add_argument(
+            "--parallelism",
+            dest="parallelism",
+            type=int,
+            help="Argon2 lanes/threads (implies --hasher argon2).",
+        )
+        parser.add_argument(
+            "--batch",
+            dest="batch",
+            metavar="FILE",
+            help=(
+                "Hash every non-blank line of FILE (one password per line) "
+                "across a process pool and print the hashes in input order."
+            ),
+        )
+        parser.add_argument(
+            "--benchmark",
+            dest="benchmark",
+            type=int,
+            metavar="ROUNDS",
+            help=(
+                "Instead of printing the hash, time ROUNDS check_password() calls "
+                "against it on this host (use to tune hasher cost)."
+            ),
+        )
 
     def handle(self, *args, **options) -> str | None:
         pwd: str | None = options.get("password")
         hasher: str = options.get("hasher") or "default"
+        argon2_costs = {
+            name: options[name]
+            for name in ARGON2_COST_OPTIONS
+            if options.get(name) is not None
+        }
+        if argon2_costs and hasher not in ("default", "argon2"):
+            msg = "Argon2 cost options require --hasher argon2."
+            raise CommandError(msg)
+
+        batch = options.get("batch")
+        if batch and options.get("benchmark"):
+            msg = "--benchmark cannot be combined with --batch."
+            raise CommandError(msg)
+        if batch:
+            self._hash_batch(Path(batch), hasher, argon2_costs)
+            return None
 
         if not pwd:
             pwd = getpass.getpass("Password: ")
@@ -45,11 +138,49 @@ class Command(BaseCommand):
                 self.stderr.write(self.style.ERROR("Passwords do not match."))
                 return None
 
-        # Use default hasher when 'default' selected; else use chosen algorithm
-        if hasher == "default":
-            hashed = make_password(pwd)
-        else:
-            hashed = make_password(pwd, hasher=hasher)
+        hashed = _hash(pwd, hasher, argon2_costs)
+
+        rounds = options.get("benchmark")
+        if rounds:
+            self._benchmark(pwd, hashed, rounds)
+            return None
+
         # Print the hash only
         self.stdout.write(hashed)
         return None
+
+    def _hash_batch(
+        self,
+        path: Path,
+        hasher: str,
+        argon2_costs: dict[str, int],
+    ) -> None:
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            msg = f"Cannot read batch file: {exc}"
+            raise CommandError(msg) from exc
+        passwords = [line for line in lines if line.strip()]
+        # Each hash is CPU-bound (and Argon2 memory-hard), so independent
+        # passwords scale across cores; map() keeps output in input order.
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_worker,
+        ) as executor:
+            for hashed in executor.map(
+                _hash,
+                passwords,
+                repeat(hasher),
+                repeat(argon2_costs),
+            ):
+                self.stdout.write(hashed)
+
+    def _benchmark(self, pwd: str, hashed: str, rounds: int) -> None:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            check_password(pwd, hashed)
+        per_check_ms = (time.perf_counter() - start) * 1000 / rounds
+        algorithm = hashed.split("$", 1)[0]
+        self.stdout.write(
+            f"{algorithm}: {per_check_ms:.1f} ms per check_password ({rounds} rounds)",
+        )
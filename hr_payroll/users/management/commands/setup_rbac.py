@@ -7,6 +7,7 @@ from django.contrib.auth.models import Group
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils.translation import gettext as _
 
 FULL_ACTIONS = ("add", "change", "delete", "view")
@@ -61,9 +62,26 @@ ROLE_MODEL_ACTIONS = {
 }
 
 
+# Inverted views of the tables above, so each model only visits matching rules.
+def _index_app_rules() -> dict[str, list[tuple[str, tuple[str, ...]]]]:
+    index: dict[str, list[tuple[str, tuple[str, ...]]]] = defaultdict(list)
+    for role_name, app_rules in ROLE_APP_ACTIONS.items():
+        for app_label, actions in app_rules.items():
+            index[app_label].append((role_name, actions))
+    return dict(index)
+
+
+APP_TO_ROLE_ACTIONS = _index_app_rules()
+MODEL_TO_ROLE_ACTIONS: dict[tuple[str, str], list[tuple[str, tuple[str, ...]]]] = {
+    model_key: list(role_actions.items())
+    for model_key, role_actions in ROLE_MODEL_ACTIONS.items()
+}
+
+
 class Command(BaseCommand):
     help = _("Create default RBAC groups and permissions")
 
+    @transaction.atomic
     def handle(self, *args, **options):
         user_model = get_user_model()
         models = self._collect_models(user_model)
@@ -105,14 +123,20 @@ class Command(BaseCommand):
         return []
 
     def _build_roles(self, models, user_model):
-        """Construct per-role permission querysets."""
+        """Construct the set of permission ids for each role."""
 
         admin_perm_ids: set[int] = set()
         role_perm_ids: dict[str, set[int]] = defaultdict(set)
 
+        # One query for every permission of the collected models, grouped by model.
+        ct_map = ContentType.objects.get_for_models(*models)
+        ct_ids = {ct.pk: model for model, ct in ct_map.items()}
+        perms_by_model: dict[type, list[Permission]] = defaultdict(list)
+        for perm in Permission.objects.filter(content_type_id__in=ct_ids):
+            perms_by_model[ct_ids[perm.content_type_id]].append(perm)
+
         for model in models:
-            ct = ContentType.objects.get_for_model(model)
-            model_perms = list(Permission.objects.filter(content_type=ct))
+            model_perms = perms_by_model.get(model)
             if not model_perms:
                 continue
 
@@ -121,63 +145,79 @@ class Command(BaseCommand):
             model_name = model._meta.model_name  # noqa: SLF001
             app_label = model._meta.app_label  # noqa: SLF001
             perms_by_codename = {perm.codename: perm for perm in model_perms}
-
-            for role_name, app_rules in ROLE_APP_ACTIONS.items():
-                actions = app_rules.get(app_label)
-                if actions:
-                    self._add_actions(
-                        role_perm_ids[role_name], perms_by_codename, model_name, actions
-                    )
-
-            for (
-                rule_app_label,
-                rule_model_name,
-            ), role_actions in ROLE_MODEL_ACTIONS.items():
-                if (rule_app_label, rule_model_name) != (app_label, model_name):
-                    continue
-                for role_name, actions in role_actions.items():
-                    self._add_actions(
-                        role_perm_ids[role_name], perms_by_codename, model_name, actions
-                    )
+            codenames = {action: f"{action}_{model_name}" for action in FULL_ACTIONS}
+
+            for role_name, actions in APP_TO_ROLE_ACTIONS.get(app_label, ()):
+                self._add_actions(
+                    role_perm_ids[role_name], perms_by_codename, codenames, actions
+                )
+            for role_name, actions in MODEL_TO_ROLE_ACTIONS.get(
+                (app_label, model_name), ()
+            ):
+                self._add_actions(
+                    role_perm_ids[role_name], perms_by_codename, codenames, actions
+                )
 
         # Guarantee employees retain at least read access to their own user records.
-        employee_view_perm = Permission.objects.filter(
-            content_type=ContentType.objects.get_for_model(user_model),
-            codename=f"view_{user_model._meta.model_name}",  # noqa: SLF001
-        ).first()
+        user_view_codename = f"view_{user_model._meta.model_name}"  # noqa: SLF001
+        employee_view_perm = next(
+            (
+                perm
+                for perm in perms_by_model.get(user_model, ())
+                if perm.codename == user_view_codename
+            ),
+            None,
+        )
         if employee_view_perm:
             role_perm_ids[ROLE_EMPLOYEE].add(employee_view_perm.pk)
 
-        roles = {
-            "Admin": {"permissions": Permission.objects.filter(pk__in=admin_perm_ids)}
-        }
+        roles = {"Admin": {"permission_ids": admin_perm_ids}}
 
         for role_name, perm_ids in role_perm_ids.items():
-            roles[role_name] = {
-                "permissions": Permission.objects.filter(pk__in=perm_ids)
-            }
+            roles[role_name] = {"permission_ids": perm_ids}
 
         return roles
 
-    def _add_actions(self, bucket, perms_by_codename, model_name, actions):
+    def _add_actions(self, bucket, perms_by_codename, codenames, actions):
         for action in actions:
-            codename = f"{action}_{model_name}"
-            perm = perms_by_codename.get(codename)
+            perm = perms_by_codename.get(codenames[action])
             if perm:
                 bucket.add(perm.pk)
 
     def _apply_roles(self, roles):
         """Create/update groups and assign permissions."""
+        role_names = list(roles)
+        Group.objects.bulk_create(
+            [Group(name=name) for name in role_names], ignore_conflicts=True
+        )
+        groups = {g.name: g for g in Group.objects.filter(name__in=role_names)}
+
+        # Write only the difference between current and target permissions.
+        through = Group.permissions.through
+        current: dict[int, set[int]] = defaultdict(set)
+        for group_id, perm_id in through.objects.filter(
+            group_id__in=[g.pk for g in groups.values()]
+        ).values_list("group_id", "permission_id"):
+            current[group_id].add(perm_id)
+
+        to_add = []
+        for role_name, conf in roles.items():
+            group = groups[role_name]
+            target = set(conf.get("permission_ids") or ())
+            existing = current[group.pk]
+            to_add.extend(
+                through(group_id=group.pk, permission_id=perm_id)
+                for perm_id in target - existing
+            )
+            stale = existing - target
+            if stale:
+                through.objects.filter(
+                    group_id=group.pk, permission_id__in=stale
+                ).delete()
+        if to_add:
+            through.objects.bulk_create(to_add, ignore_conflicts=True)
+
         for role_name, conf in roles.items():
-            group, _ = Group.objects.get_or_create(name=role_name)
-            perms = conf.get("permissions", [])
-            if perms:
-                perm_ids = {p.pk for p in perms}
-                unique_perms = Permission.objects.filter(pk__in=perm_ids)
-                group.permissions.set(list(unique_perms))  # type: ignore[arg-type]
-                count = unique_perms.count()
-            else:
-                group.permissions.clear()
-                count = 0
+            count = len(conf.get("permission_ids") or ())
             msg = f"Ensured group '{role_name}' with permissions ({count})"
             self.stdout.write(self.style.SUCCESS(msg))
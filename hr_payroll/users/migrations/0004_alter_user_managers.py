@@ -0,0 +1,20 @@
+# Generated by Django 5.1.11 on 2026-10-16 16:40
+
+import hr_payroll.users.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_users_email_upper_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', hr_payroll.users.models.UserManager()),
+            ],
+        ),
+    ]
@@ -1,10 +1,36 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import UserManager as DjangoUserManager
 from django.db import models
+from django.db import transaction
 from django.db.models import CharField
 from django.db.models import EmailField
-from django.urls import reverse
+from django.db.models.functions import Upper
+from django.urls import NoReverseMatch
 from django.utils.translation import gettext_lazy as _
 
+from hr_payroll.users.urls_cache import user_url
+
+
+class UserManager(DjangoUserManager):
+    def bulk_create_with_default_group(self, users, batch_size=1000):
+        """Bulk-insert users and give them the default group in O(1) queries.
+
+        `bulk_create` skips `User.save()` and sends no `post_save`, so `name`
+        is built here and the default group links are inserted in one batch
+        instead of per user by `add_default_employee_group`. Any other
+        `post_save` receivers on User do not run, so only use this for
+        imports that need nothing beyond the default role.
+        """
+        from hr_payroll.users.signals import assign_default_group  # noqa: PLC0415
+
+        users = list(users)
+        for user in users:
+            user.name = f"{user.first_name} {user.last_name}".strip()
+        with transaction.atomic(using=self.db):
+            created = self.bulk_create(users, batch_size=batch_size)
+            assign_default_group(created, batch_size=batch_size)
+        return created
+
 
 class User(AbstractUser):
     """
@@ -25,10 +51,26 @@ class User(AbstractUser):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UserManager()
+
+    class Meta(AbstractUser.Meta):
+        # On PostgreSQL `iexact` compiles to UPPER(col) = UPPER(%s); these back
+        # the username-or-email login lookup.
+        indexes = [
+            models.Index(Upper("email"), name="users_email_upper_idx"),
+            models.Index(Upper("username"), name="users_username_upper_idx"),
+        ]
+
     def save(self, *args, **kwargs):
-        # Automatically build th full name
-        full_name = f"{self.first_name} {self.last_name}".strip()
-        self.name = full_name
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            # Automatically build th full name
+            self.name = f"{self.first_name} {self.last_name}".strip()
+        elif {"first_name", "last_name"} & set(update_fields):
+            # Partial saves (e.g. last_login) leave the name alone; rebuild it
+            # only when a name part is written, and write it alongside.
+            self.name = f"{self.first_name} {self.last_name}".strip()
+            kwargs["update_fields"] = {*update_fields, "name"}
         super().save(*args, **kwargs)
 
     def get_absolute_url(self) -> str:
@@ -38,7 +80,17 @@ class User(AbstractUser):
             str: URL for user detail.
 
         """
-        return reverse("users:detail", kwargs={"username": self.username})
+        url = user_url("users:detail", self.username)
+        if url is None:
+            msg = f"No users:detail URL for username {self.username!r}."
+            raise NoReverseMatch(msg)
+        return url
+
+
+class UserProfileManager(models.Manager):
+    def get_queryset(self):
+        # `__str__` and every profile listing read the owning user.
+        return super().get_queryset().select_related("user")
 
 
 class UserProfile(models.Model):
@@ -59,5 +111,7 @@ class UserProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UserProfileManager()
+
     def __str__(self) -> str:  # pragma: no cover - trivial
         return f"Profile({self.user.username})"
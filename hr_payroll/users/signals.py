@@ -1,22 +1,97 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from hr_payroll.users.api.permissions import clear_group_names
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from hr_payroll.users.models import User
+
+
+DEFAULT_GROUP_NAME = "Employee"
+
+# pk of the default group, shared by every signup in this process. It is only
+# stored once the transaction that read it has committed, so a rolled-back
+# get_or_create (or test transaction) can never leave a dangling id behind.
+_employee_group_id: int | None = None
+
+
+def _remember_employee_group(group_id: int | None) -> None:
+    global _employee_group_id  # noqa: PLW0603
+    _employee_group_id = group_id
+
+
+@receiver(post_delete, sender=Group)
+def forget_employee_group(sender, **kwargs):
+    _remember_employee_group(None)
+
+
+def seed_default_group(sender, using="default", **kwargs):
+    """post_migrate hook: make sure the default group exists and cache its pk.
+
+    Runs after `migrate` and `flush`, so signups normally never need the
+    get_or_create path in `employee_group_id`.
+    """
+
+    group, _ = Group.objects.using(using).get_or_create(name=DEFAULT_GROUP_NAME)
+    _remember_employee_group(None)
+    transaction.on_commit(lambda: _remember_employee_group(group.pk), using=using)
+
+
+def employee_group_id() -> int:
+    """Return the default group's pk, creating the group if it is missing."""
+
+    if _employee_group_id is not None:
+        return _employee_group_id
+    group, _ = Group.objects.get_or_create(name=DEFAULT_GROUP_NAME)
+    transaction.on_commit(lambda: _remember_employee_group(group.pk))
+    return group.pk
+
+
+def assign_default_group(users: Iterable[User], batch_size: int = 1000) -> None:
+    """Link saved users to the default group with one INSERT per batch."""
+
+    through = get_user_model().groups.through
+    group_id = employee_group_id()
+    users = list(users)
+    through.objects.bulk_create(
+        [through(user_id=user.pk, group_id=group_id) for user in users],
+        batch_size=batch_size,
+        ignore_conflicts=True,
+    )
+    for user in users:
+        clear_group_names(user)
+
 
 @receiver(post_save, sender=get_user_model())
 def add_default_employee_group(sender, instance, created, **kwargs):
     """Assign every newly created user to the least-privileged 'Employee' group.
 
     This ensures new signups have a default role without requiring manual admin action.
-    Safe to call repeatedly; the group is created if missing.
+    Safe to call repeatedly; the group is created if missing. Once the group's
+    pk is known this is a single INSERT into the user/group through table.
     """
 
     if not created:
         return
 
-    group, _ = Group.objects.get_or_create(name="Employee")
     # Add user to default group (idempotent)
-    instance.groups.add(group)
+    assign_default_group([instance])
+
+
+@receiver(m2m_changed, sender=get_user_model().groups.through)
+def clear_memoized_group_names(sender, instance, action, reverse, **kwargs):
+    """Keep `get_group_names` honest when a user instance's groups change."""
+
+    if not reverse and action.startswith("post_"):
+        clear_group_names(instance)
@@ -3,28 +3,45 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from rest_framework import status
-from rest_framework.test import APITestCase
-
-
-@pytest.mark.skipif(
-    not getattr(settings, "DJOSER_ENABLED", False),
-    reason="Djoser endpoints disabled in settings",
-)
-class TestDjoserJWTFlow(APITestCase):
-    def test_register_login_refresh_and_me(self):
-        # 0) Prepare: create a Manager and authenticate (registration restricted)
-        user_model = get_user_model()
-        manager = user_model.objects.create_user(
-            username="manager",
-            email="manager@example.com",
-            password="ManagerPass!123",  # noqa: S106
-        )
-        manager.is_active = True
-        manager.save()
-        # Add Manager group
-        mgr_group, _ = Group.objects.get_or_create(name="Manager")
-        manager.groups.add(mgr_group)
-        self.client.force_authenticate(user=manager)
+from rest_framework.test import APIClient
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        not getattr(settings, "DJOSER_ENABLED", False),
+        reason="Djoser endpoints disabled in settings",
+    ),
+]
+
+
+@pytest.fixture
+def user_model():
+    return get_user_model()
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def manager(user_model):
+    mgr = user_model.objects.create_user(
+        username="manager",
+        email="manager@example.com",
+        password="ManagerPass!123",  # noqa: S106
+        is_active=True,
+    )
+    # Add Manager group
+    mgr_group, _ = Group.objects.get_or_create(name="Manager")
+    mgr.groups.add(mgr_group)
+    return mgr
+
+
+class TestDjoserJWTFlow:
+    def test_register_login_refresh_and_me(self, api_client, manager, user_model):
+        # 0) Prepare: authenticate as a Manager (registration restricted)
+        api_client.force_authenticate(user=manager)
 
         # 1) Register (as Manager)
         payload = {
@@ -33,7 +50,7 @@ class TestDjoserJWTFlow(APITestCase):
             "password": "testPassword123!",  # Allow hardcoded password in test
             "re_password": "testPassword123!",  # Allow hardcoded password in test
         }
-        r = self.client.post("/api/v1/auth/users/", payload, format="json")
+        r = api_client.post("/api/v1/auth/users/", payload, format="json")
         assert r.status_code in (status.HTTP_201_CREATED, status.HTTP_204_NO_CONTENT)
 
         # User is active immediately (activation emails disabled)
@@ -42,8 +59,8 @@ class TestDjoserJWTFlow(APITestCase):
 
         # 2) Login (JWT create)
         # Clear manager force-auth so JWT auth is used
-        self.client.force_authenticate(user=None)
-        r = self.client.post(
+        api_client.force_authenticate(user=None)
+        r = api_client.post(
             "/api/v1/auth/jwt/create/",
             {
                 "username": "testseud",
@@ -58,7 +75,7 @@ class TestDjoserJWTFlow(APITestCase):
         assert refresh is not None
 
         # 3) Refresh
-        r = self.client.post(
+        r = api_client.post(
             "/api/v1/auth/jwt/refresh/",
             {"refresh": refresh},
             format="json",
@@ -69,24 +86,22 @@ class TestDjoserJWTFlow(APITestCase):
 
         # 4) Me with Bearer token
         # Ensure no lingering force-auth; use Bearer token
-        self.client.force_authenticate(user=None)
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {new_access}")
-        r = self.client.get("/api/v1/auth/users/me/")
+        api_client.force_authenticate(user=None)
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {new_access}")
+        r = api_client.get("/api/v1/auth/users/me/")
         assert r.status_code == status.HTTP_200_OK
         assert r.data["username"] == "testseud"
         assert r.data["email"] == "testseud@gmail.com"
 
-    def test_login_with_email_value_in_username_field(self):
-        user_model = get_user_model()
-        user = user_model.objects.create_user(
+    def test_login_with_email_value_in_username_field(self, api_client, user_model):
+        user_model.objects.create_user(
             username="bob",
             email="bob@example.com",
             password="StrongPass!234",  # noqa: S106
+            is_active=True,
         )
-        user.is_active = True
-        user.save()
 
-        r = self.client.post(
+        r = api_client.post(
             "/api/v1/auth/jwt/create/",
             {
                 "username": "bob@example.com",
@@ -97,3 +112,11 @@ class TestDjoserJWTFlow(APITestCase):
         assert r.status_code == status.HTTP_200_OK
         assert "access" in r.data
         assert "refresh" in r.data
+
+    def test_me_returns_authenticated_user(self, api_client, manager):
+        # The JWT round-trip is covered above; this checks /me on its own.
+        api_client.force_authenticate(user=manager)
+        r = api_client.get("/api/v1/auth/users/me/")
+        assert r.status_code == status.HTTP_200_OK
+        assert r.data["username"] == "manager"
+        assert r.data["email"] == "manager@example.com"
@@ -5,6 +5,8 @@ from django.contrib.auth.models import Group
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from hr_payroll.users.api.permissions import get_group_names
+
 pytestmark = pytest.mark.django_db
 
 
@@ -69,3 +71,12 @@ def test_regular_user_cannot_reset_username(employee):
     )
     # Should be forbidden (permission restricted to Manager/Admin)
     assert r.status_code in (status.HTTP_403_FORBIDDEN, status.HTTP_401_UNAUTHORIZED)
+
+
+def test_group_names_memo_is_cleared_when_groups_change(employee):
+    assert get_group_names(employee) == frozenset({"Employee"})
+
+    g, _ = Group.objects.get_or_create(name="Manager")
+    employee.groups.add(g)
+
+    assert get_group_names(employee) == frozenset({"Employee", "Manager"})
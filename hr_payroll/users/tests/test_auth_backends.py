@@ -121,3 +121,15 @@ class TestUsernameOrEmailBackend:
             password="wrongpass",  # noqa: S106
         )
         assert user is None
+
+    def test_old_password_rejected_after_change(self):
+        assert self.backend.authenticate(None, username="test", password=self.password)
+        self.user.set_password("N3wPassword!")
+        self.user.save()
+
+        user = self.backend.authenticate(
+            None,
+            username="test",
+            password=self.password,
+        )
+        assert user is None
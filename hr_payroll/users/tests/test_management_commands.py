@@ -1,6 +1,14 @@
+from io import StringIO
+
+import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import Argon2PasswordHasher
+from django.contrib.auth.hashers import check_password
 from django.contrib.auth.models import Group
 from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count
+from django.db.models import Q
 
 
 def test_setup_rbac_creates_default_groups(db):
@@ -9,22 +17,96 @@ def test_setup_rbac_creates_default_groups(db):
 
     call_command("setup_rbac")
 
-    for name in expected_groups:
-        assert Group.objects.filter(name=name).exists()
-
     user_model = get_user_model()
     model_codename = user_model._meta.model_name  # noqa: SLF001
 
-    admin = Group.objects.get(name="Admin")
-    manager = Group.objects.get(name="Manager")
-    payroll = Group.objects.get(name="Payroll")
-    line_manager = Group.objects.get(name="Line Manager")
-    employee = Group.objects.get(name="Employee")
-
-    assert admin.permissions.filter(codename__icontains=model_codename).exists()
-    assert manager.permissions.filter(
-        codename__in=[f"view_{model_codename}", f"change_{model_codename}"]
-    ).exists()
-    assert payroll.permissions.filter(codename__icontains="payroll").exists()
-    assert line_manager.permissions.filter(codename__icontains="attendance").exists()
-    assert employee.permissions.filter(codename__startswith="view_").exists()
+    stats = {
+        row["name"]: row
+        for row in Group.objects.filter(name__in=expected_groups)
+        .values("name")
+        .annotate(
+            user_model=Count(
+                "permissions",
+                filter=Q(permissions__codename__icontains=model_codename),
+            ),
+            view_or_change_user=Count(
+                "permissions",
+                filter=Q(
+                    permissions__codename__in=[
+                        f"view_{model_codename}",
+                        f"change_{model_codename}",
+                    ]
+                ),
+            ),
+            payroll=Count(
+                "permissions", filter=Q(permissions__codename__icontains="payroll")
+            ),
+            attendance=Count(
+                "permissions", filter=Q(permissions__codename__icontains="attendance")
+            ),
+            view=Count(
+                "permissions", filter=Q(permissions__codename__startswith="view_")
+            ),
+        )
+    }
+    assert set(stats) == set(expected_groups)
+
+    assert stats["Admin"]["user_model"]
+    assert stats["Manager"]["view_or_change_user"]
+    assert stats["Payroll"]["payroll"]
+    assert stats["Line Manager"]["attendance"]
+    assert stats["Employee"]["view"]
+
+
+def test_hash_password_batch_hashes_each_non_blank_line(tmp_path):
+    batch = tmp_path / "passwords.txt"
+    batch.write_text("alpha\n\n  \nbeta\n", encoding="utf-8")
+    out = StringIO()
+
+    call_command("hash_password", "--batch", str(batch), stdout=out)
+
+    hashes = out.getvalue().splitlines()
+    assert len(hashes) == 2
+    assert check_password("alpha", hashes[0])
+    assert check_password("beta", hashes[1])
+
+
+def test_hash_password_batch_rejects_benchmark(tmp_path):
+    batch = tmp_path / "passwords.txt"
+    batch.write_text("alpha\n", encoding="utf-8")
+
+    with pytest.raises(CommandError):
+        call_command("hash_password", "--batch", str(batch), "--benchmark", "1")
+
+
+def test_hash_password_encodes_argon2_cost_options():
+    out = StringIO()
+
+    call_command(
+        "hash_password",
+        "--password",
+        "s3cret",
+        "--time-cost",
+        "3",
+        "--memory-cost",
+        "1024",
+        "--parallelism",
+        "2",
+        stdout=out,
+    )
+
+    hashed = out.getvalue().strip()
+    assert "$m=1024,t=3,p=2$" in hashed
+    assert Argon2PasswordHasher().verify("s3cret", hashed)
+
+
+def test_hash_password_benchmark_prints_timings_not_the_hash():
+    out = StringIO()
+
+    call_command(
+        "hash_password", "--password", "s3cret", "--benchmark", "2", stdout=out
+    )
+
+    output = out.getvalue()
+    assert "ms per check_password (2 rounds)" in output
+    assert "$" not in output
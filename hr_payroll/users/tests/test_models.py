@@ -1,5 +1,54 @@
+import pytest
+from django.urls import NoReverseMatch
+
 from hr_payroll.users.models import User
 
 
 def test_user_get_absolute_url(user: User):
     assert user.get_absolute_url() == f"/users/{user.username}/"
+
+
+def test_user_get_absolute_url_rejects_slash_like_reverse():
+    with pytest.raises(NoReverseMatch):
+        User(username="a/b").get_absolute_url()
+
+
+def test_partial_save_only_rebuilds_name_with_name_parts(user: User):
+    user.first_name = "Ada"
+    user.last_name = "Lovelace"
+    user.save(update_fields=["last_login"])
+    user.refresh_from_db()
+    assert user.name != "Ada Lovelace"
+
+    user.first_name = "Ada"
+    user.last_name = "Lovelace"
+    user.save(update_fields=["first_name", "last_name"])
+    user.refresh_from_db()
+    assert user.name == "Ada Lovelace"
+
+
+@pytest.mark.django_db
+def test_bulk_create_with_default_group():
+    users = User.objects.bulk_create_with_default_group(
+        [
+            User(
+                username=f"bulk{i}",
+                email=f"bulk{i}@example.com",
+                first_name="Bulk",
+                last_name=str(i),
+            )
+            for i in range(3)
+        ],
+    )
+
+    assert all(user.pk for user in users)
+    names = User.objects.filter(pk__in=[u.pk for u in users]).values_list(
+        "name", flat=True
+    )
+    assert sorted(names) == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    assert (
+        User.objects.filter(pk__in=[u.pk for u in users], groups__name="Employee")
+        .distinct()
+        .count()
+        == 3
+    )
@@ -0,0 +1,53 @@
+from functools import lru_cache
+from urllib.parse import quote
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import NoReverseMatch
+from django.urls import get_script_prefix
+from django.urls import get_urlconf
+from django.urls import reverse
+from django.utils.http import RFC3986_SUBDELIMS
+
+_USERNAME_PLACEHOLDER = "__username__"
+
+
+@lru_cache(maxsize=16)
+def _user_url_template(
+    view_name: str,
+    script_prefix: str,
+    urlconf: str | None,
+) -> str | None:
+    """`view_name` reversed once per script prefix/URLconf, as a template.
+
+    Misses are cached as None, so a route that does not exist only raises
+    `NoReverseMatch` once.
+    """
+
+    try:
+        url = reverse(view_name, kwargs={"username": _USERNAME_PLACEHOLDER})
+    except NoReverseMatch:
+        return None
+    return url.replace(_USERNAME_PLACEHOLDER, "{username}")
+
+
+@receiver(setting_changed)
+def _reset_user_url_templates(*, setting, **kwargs):
+    if setting == "ROOT_URLCONF":
+        _user_url_template.cache_clear()
+
+
+def user_url(view_name: str, username: str) -> str | None:
+    """Reverse a `<username>` route without walking the resolver per call.
+
+    Returns None where `reverse` would raise `NoReverseMatch`: the route is
+    not registered, or the username cannot match its `[^/]+` segment.
+    """
+
+    if not username or "/" in username:
+        return None
+    template = _user_url_template(view_name, get_script_prefix(), get_urlconf())
+    if template is None:
+        return None
+    # Quote the way `reverse` does.
+    return template.format(username=quote(username, safe=RFC3986_SUBDELIMS + "~:@"))
@@ -5,16 +5,20 @@ from typing import TYPE_CHECKING
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.db.models import prefetch_related_objects
 
 from hr_payroll.employees.models import Employee
+from hr_payroll.users.api.permissions import get_group_names
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
-
-    from hr_payroll.org.models import Department
+    from collections.abc import Sequence
+    from typing import Any
 
 User = get_user_model()
 
+TEST_PASSWORD = "TestPass123!"  # noqa: S105 - test credentials only
+
 
 @dataclass
 class RoleContext:
@@ -22,34 +26,73 @@ class RoleContext:
     employee: Employee
 
 
-def ensure_groups(names: Iterable[str]) -> None:
-    for name in names:
-        Group.objects.get_or_create(name=name)
-
-
-def create_user_with_role(
-    username: str,
-    *,
-    groups: Iterable[str] | None = None,
-    is_staff: bool = False,
-    department: Department | None = None,
-    line_manager: Employee | None = None,
-) -> RoleContext:
-    ensure_groups(groups or [])
-    user = User.objects.create_user(
-        username=username,
-        email=f"{username}@example.com",
-        password="TestPass123!",  # noqa: S106
+def ensure_groups(names: Iterable[str]) -> dict[str, Group]:
+    """Return the named groups, creating missing ones, in at most 3 queries."""
+    names = list(dict.fromkeys(names))
+    groups = {group.name: group for group in Group.objects.filter(name__in=names)}
+    missing = [name for name in names if name not in groups]
+    if missing:
+        Group.objects.bulk_create(
+            [Group(name=name) for name in missing], ignore_conflicts=True
+        )
+        groups.update(
+            (group.name, group) for group in Group.objects.filter(name__in=missing)
+        )
+    return groups
+
+
+def create_users_with_roles_bulk(specs: Sequence[dict[str, Any]]) -> list[RoleContext]:
+    """Create users with roles and an employee each; one INSERT per table.
+
+    Each spec is a dict with a "username" plus optional keys:
+
+    - "groups": role group names, created if missing.
+    - "is_staff": defaults to False.
+    - "department": the employee's `Department`.
+    - "line_manager": the employee's line manager `Employee`. It must already
+      be saved, so reports go in a later call than their manager.
+    """
+    role_groups = ensure_groups(
+        name for spec in specs for name in spec.get("groups") or []
+    )
+    users = []
+    for spec in specs:
+        username = spec["username"]
+        user = User(
+            username=username,
+            email=f"{username}@example.com",
+            is_staff=spec.get("is_staff", False),
+        )
+        user.set_password(TEST_PASSWORD)
+        users.append(user)
+    users = User.objects.bulk_create_with_default_group(users)
+
+    through = User.groups.through
+    through.objects.bulk_create(
+        [
+            through(user_id=user.pk, group_id=role_groups[name].pk)
+            for user, spec in zip(users, specs, strict=True)
+            for name in spec.get("groups") or []
+        ],
+        ignore_conflicts=True,
     )
-    if is_staff:
-        user.is_staff = True
-        user.save(update_fields=["is_staff"])
-    for group_name in groups or []:
-        user.groups.add(Group.objects.get(name=group_name))
-    employee = Employee.objects.create(
-        user=user,
-        department=department,
-        line_manager=line_manager,
-        is_active=True,
+    # Warm the memo the permission classes read, with one query for every
+    # user's groups, so no test request has to query them again.
+    prefetch_related_objects(users, "groups")
+    for user in users:
+        get_group_names(user)
+    employees = Employee.objects.bulk_create(
+        [
+            Employee(
+                user=user,
+                department=spec.get("department"),
+                line_manager=spec.get("line_manager"),
+                is_active=True,
+            )
+            for user, spec in zip(users, specs, strict=True)
+        ],
     )
-    return RoleContext(user=user, employee=employee)
+    return [
+        RoleContext(user=user, employee=employee)
+        for user, employee in zip(users, employees, strict=True)
+    ]
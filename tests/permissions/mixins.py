@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+from functools import cache
+from operator import itemgetter
+
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework.test import APIRequestFactory
 from rest_framework.test import APITestCase
+from rest_framework.test import force_authenticate
 
 from hr_payroll.attendance.models import Attendance
+from hr_payroll.attendance.models import OfficeNetwork
 from hr_payroll.leaves.models import LeavePolicy
 from hr_payroll.leaves.models import LeaveRequest
 from hr_payroll.leaves.models import LeaveType
 from hr_payroll.org.models import Department
 from hr_payroll.payroll.models import BankMaster
 from tests.permissions.factories import RoleContext
-from tests.permissions.factories import create_user_with_role
+from tests.permissions.factories import create_users_with_roles_bulk
 from tests.permissions.factories import ensure_groups
 
 User = get_user_model()
@@ -26,134 +35,160 @@ ROLE_EMPLOYEE = "Employee"
 RBAC_GROUPS = [ROLE_ADMIN, ROLE_MANAGER, ROLE_PAYROLL, ROLE_LINE_MANAGER, ROLE_EMPLOYEE]
 
 
-class RoleAPITestCase(APITestCase):
-    """Base test case to streamline RBAC fixtures and helpers."""
+@cache
+def _reverse(url_name: str, kwargs_items: tuple = ()) -> str:
+    # URL patterns are fixed for the test run; resolve each route once.
+    return reverse(url_name, kwargs=dict(kwargs_items) or None)
 
-    def setUp(self):
-        super().setUp()
+
+def resolve_url(url_name: str, reverse_kwargs=None) -> str:
+    return _reverse(url_name, tuple(sorted((reverse_kwargs or {}).items())))
+
+
+_employee_of = itemgetter("employee")
+
+
+class RoleFixtureTestCase(APITestCase):
+    """Base test case with RBAC users/employees, departments and helpers.
+
+    Domain rows (leaves, attendance) come from the fixture mixins below, so
+    a test class only inserts what it reads.
+    """
+
+    factory = APIRequestFactory()
+
+    @classmethod
+    def setUpTestData(cls):
+        # Built once per class; TestCase rolls back each test's writes and
+        # hands every test its own deep copy of these attributes.
+        super().setUpTestData()
         ensure_groups(RBAC_GROUPS)
-        self.departments = {
-            "hq": self._create_department("HQ"),
-            "remote": self._create_department("Remote"),
+        cls.departments = {
+            "hq": cls._create_department("HQ"),
+            "remote": cls._create_department("Remote"),
         }
-        self.roles: dict[str, RoleContext] = {}
-        self.roles[ROLE_ADMIN] = create_user_with_role(
-            "admin",
-            groups=[ROLE_ADMIN],
-            is_staff=True,
-            department=self.departments["hq"],
+        hq = cls.departments["hq"]
+        admin, manager, payroll, line_manager, other = create_users_with_roles_bulk(
+            [
+                {
+                    "username": "admin",
+                    "groups": [ROLE_ADMIN],
+                    "is_staff": True,
+                    "department": hq,
+                },
+                {"username": "manager", "groups": [ROLE_MANAGER], "department": hq},
+                {"username": "payroll", "groups": [ROLE_PAYROLL], "department": hq},
+                {
+                    "username": "linemgr",
+                    "groups": [ROLE_LINE_MANAGER],
+                    "department": hq,
+                },
+                {
+                    "username": "other",
+                    "groups": [ROLE_EMPLOYEE],
+                    "department": cls.departments["remote"],
+                },
+            ],
         )
-        self.roles[ROLE_MANAGER] = create_user_with_role(
-            "manager",
-            groups=[ROLE_MANAGER],
-            department=self.departments["hq"],
+        # Needs the line manager's employee pk, so it goes in a second batch.
+        (employee,) = create_users_with_roles_bulk(
+            [
+                {
+                    "username": "employee",
+                    "groups": [ROLE_EMPLOYEE],
+                    "line_manager": line_manager.employee,
+                    "department": hq,
+                },
+            ],
         )
-        self.roles[ROLE_PAYROLL] = create_user_with_role(
-            "payroll",
-            groups=[ROLE_PAYROLL],
-            department=self.departments["hq"],
-        )
-        self.roles[ROLE_LINE_MANAGER] = create_user_with_role(
-            "linemgr",
-            groups=[ROLE_LINE_MANAGER],
-            department=self.departments["hq"],
-        )
-        self.roles[ROLE_EMPLOYEE] = create_user_with_role(
-            "employee",
-            groups=[ROLE_EMPLOYEE],
-            line_manager=self.roles[ROLE_LINE_MANAGER].employee,
-            department=self.departments["hq"],
-        )
-        self.others = {
-            "employee": create_user_with_role(
-                "other",
-                groups=[ROLE_EMPLOYEE],
-                department=self.departments["remote"],
-            )
+        cls.roles: dict[str, RoleContext] = {
+            ROLE_ADMIN: admin,
+            ROLE_MANAGER: manager,
+            ROLE_PAYROLL: payroll,
+            ROLE_LINE_MANAGER: line_manager,
+            ROLE_EMPLOYEE: employee,
         }
-        self.departments["remote"].manager = self.roles[ROLE_MANAGER].employee
-        self.departments["remote"].save(update_fields=["manager", "updated_at"])
-
-        self.bank_master = BankMaster.objects.create(name="Bank A")
-        self.leave_type = LeaveType.objects.create(
-            name="Annual",
-            color_code="#00FF00",
-            description="Annual leave",
+        cls.others = {"employee": other}
+        cls.expected_employee_count = len(cls.roles) + len(cls.others)
+        # Employee pks the tests put in URLs and payloads.
+        cls.employee_pk = employee.employee.pk
+        cls.manager_pk = manager.employee.pk
+        cls.line_mgr_pk = line_manager.employee.pk
+        cls.other_employee_pk = other.employee.pk
+        cls.employee_email = employee.user.email
+        # Plain UPDATE; keep the in-memory instance in step without a reload.
+        remote = cls.departments["remote"]
+        remote.manager = manager.employee
+        Department.objects.filter(pk=remote.pk).update(
+            manager=manager.employee, updated_at=timezone.now()
         )
-        self.leave_policy = LeavePolicy.objects.create(
-            leave_type=self.leave_type,
-            name="Annual Policy",
-            description="Policy",
-            entitlement=10,
-            max_carry_over=5,
-            carry_over_expire_month=12,
-            carry_over_expire_day=31,
-        )
-        self.leave_requests = {
-            "team": LeaveRequest.objects.create(
-                employee=self.roles[ROLE_EMPLOYEE].employee,
-                policy=self.leave_policy,
-                start_date=timezone.now().date(),
-                end_date=timezone.now().date(),
-                duration=1,
-            ),
-            "other": LeaveRequest.objects.create(
-                employee=self.others["employee"].employee,
-                policy=self.leave_policy,
-                start_date=timezone.now().date(),
-                end_date=timezone.now().date(),
-                duration=1,
-            ),
-        }
-        self.attendance_records = {
-            "team": Attendance.objects.create(
-                employee=self.roles[ROLE_EMPLOYEE].employee,
-                date=timezone.now().date(),
-                clock_in=timezone.now(),
-                clock_in_location="HQ kiosk",
-            ),
-            "other": Attendance.objects.create(
-                employee=self.others["employee"].employee,
-                date=timezone.now().date(),
-                clock_in=timezone.now(),
-                clock_in_location="Remote kiosk",
-            ),
-        }
+
+        cls.bank_master = BankMaster.objects.create(name="Bank A")
 
     # Utilities -------------------------------------------------------------
-    def _create_department(self, name: str):
+    @classmethod
+    def _create_department(cls, name: str):
         return Department.objects.create(name=name)
 
-    def authenticate(self, role: str):
-        self.client.force_authenticate(user=self.roles[role].user)
+    def setUp(self):
+        super().setUp()
+        # One force-authenticated client per role, built on first use. Tests
+        # that alternate roles keep each role's request.user (and the group
+        # names memoized on it) instead of re-authenticating a shared client.
+        self._role_clients: dict[str, APIClient] = {}
+
+    def client_for(self, role: str) -> APIClient:
+        client = self._role_clients.get(role)
+        if client is None:
+            client = self.client_class()
+            client.force_authenticate(user=self.roles[role].user)
+            self._role_clients[role] = client
+        return client
 
     def assert_http_status(self, response, expected_status: int):
         msg = getattr(response, "data", response)
         assert response.status_code == expected_status, msg
 
     def get(self, url_name: str, *, role: str, reverse_kwargs=None, **kwargs):
-        self.authenticate(role)
-        url = reverse(url_name, kwargs=reverse_kwargs)
-        return self.client.get(url, **kwargs)
+        url = resolve_url(url_name, reverse_kwargs)
+        return self.client_for(role).get(url, **kwargs)
 
     def post(
         self, url_name: str, *, role: str, payload=None, reverse_kwargs=None, **kwargs
     ):
-        self.authenticate(role)
-        url = reverse(url_name, kwargs=reverse_kwargs)
-        return self.client.post(url, data=payload or {}, format="json", **kwargs)
+        client = self.client_for(role)
+        url = resolve_url(url_name, reverse_kwargs)
+        return client.post(url, data=payload or {}, format="json", **kwargs)
 
     def patch(
         self, url_name: str, *, role: str, payload=None, reverse_kwargs=None, **kwargs
     ):
-        self.authenticate(role)
-        url = reverse(url_name, kwargs=reverse_kwargs)
-        return self.client.patch(url, data=payload or {}, format="json", **kwargs)
+        client = self.client_for(role)
+        url = resolve_url(url_name, reverse_kwargs)
+        return client.patch(url, data=payload or {}, format="json", **kwargs)
 
     def delete(self, url_name: str, *, role: str, reverse_kwargs=None, **kwargs):
-        self.authenticate(role)
-        url = reverse(url_name, kwargs=reverse_kwargs)
-        return self.client.delete(url, **kwargs)
+        url = resolve_url(url_name, reverse_kwargs)
+        return self.client_for(role).delete(url, **kwargs)
+
+    def direct(self, view, method: str, url_name: str, *, role: str, **kwargs):
+        """Call `view` straight away, skipping middleware and URL resolution.
+
+        Only for tests about view-level behaviour (permissions, queryset
+        scoping); the response is not rendered, so read `response.data`.
+        `payload` and `reverse_kwargs` work as in `post`; other keywords go
+        to the request factory.
+        """
+        payload = kwargs.pop("payload", None)
+        reverse_kwargs = kwargs.pop("reverse_kwargs", None)
+        url = resolve_url(url_name, reverse_kwargs)
+        if method == "get":
+            request = self.factory.get(url, data=payload, **kwargs)
+        else:
+            factory_method = getattr(self.factory, method)
+            request = factory_method(url, data=payload, format="json", **kwargs)
+        force_authenticate(request, user=self.roles[role].user)
+        return view(request, **(reverse_kwargs or {}))
 
     def assert_allowed(self, response):
         assert response.status_code in (
@@ -167,6 +202,98 @@ class RoleAPITestCase(APITestCase):
 
     def extract_results(self, response):
         data = response.data
-        if isinstance(data, dict) and "results" in data:
-            return data["results"]
+        if isinstance(data, dict):
+            return data.get("results", [])
         return data if isinstance(data, list) else []
+
+    def count_queries(self, func) -> int:
+        """Number of SQL queries `func()` runs."""
+        with CaptureQueriesContext(connection) as ctx:
+            func()
+        return len(ctx.captured_queries)
+
+    def employee_ids(self, response) -> set[int]:
+        """Employee pks of the rows in a (possibly paginated) list response."""
+        return set(map(_employee_of, self.extract_results(response)))
+
+
+class LeaveFixtureMixin:
+    """Adds an annual leave policy and one leave request per team."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        today = timezone.now().date()
+        cls.leave_type = LeaveType.objects.create(
+            name="Annual",
+            color_code="#00FF00",
+            description="Annual leave",
+        )
+        cls.leave_policy = LeavePolicy.objects.create(
+            leave_type=cls.leave_type,
+            name="Annual Policy",
+            description="Policy",
+            entitlement=10,
+            max_carry_over=5,
+            carry_over_expire_month=12,
+            carry_over_expire_day=31,
+        )
+        cls.leave_requests = {
+            "team": LeaveRequest.objects.create(
+                employee=cls.roles[ROLE_EMPLOYEE].employee,
+                policy=cls.leave_policy,
+                start_date=today,
+                end_date=today,
+                duration=1,
+            ),
+            "other": LeaveRequest.objects.create(
+                employee=cls.others["employee"].employee,
+                policy=cls.leave_policy,
+                start_date=today,
+                end_date=today,
+                duration=1,
+            ),
+        }
+
+
+class AttendanceFixtureMixin:
+    """Adds today's clock-in for the team employee and the other employee."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        now = timezone.now()
+        cls.attendance_records = {
+            "team": Attendance.objects.create(
+                employee=cls.roles[ROLE_EMPLOYEE].employee,
+                date=now.date(),
+                clock_in=now,
+                clock_in_location="HQ kiosk",
+            ),
+            "other": Attendance.objects.create(
+                employee=cls.others["employee"].employee,
+                date=now.date(),
+                clock_in=now,
+                clock_in_location="Remote kiosk",
+            ),
+        }
+
+
+class OfficeNetworkFixtureMixin:
+    """Registers loopback as an office network for self check-in tests.
+
+    Only classes that punch in need it; the rest run with no network so they
+    still catch code that wrongly depends on one.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Lets the test client's 127.0.0.1 pass the office-network check.
+        OfficeNetwork.objects.create(
+            label="Loopback", cidr="127.0.0.1/32", is_active=True
+        )
+
+
+class RoleAPITestCase(LeaveFixtureMixin, AttendanceFixtureMixin, RoleFixtureTestCase):
+    """Full RBAC fixture set: roles plus leave and attendance rows."""
@@ -1,33 +1,57 @@
 from datetime import timedelta
 
-from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 
-from hr_payroll.attendance.models import OfficeNetwork
+from hr_payroll.attendance.api.views import AttendanceViewSet
+from hr_payroll.attendance.models import Attendance
 from tests.permissions.mixins import ROLE_EMPLOYEE
 from tests.permissions.mixins import ROLE_LINE_MANAGER
 from tests.permissions.mixins import ROLE_MANAGER
-from tests.permissions.mixins import RoleAPITestCase
+from tests.permissions.mixins import AttendanceFixtureMixin
+from tests.permissions.mixins import OfficeNetworkFixtureMixin
+from tests.permissions.mixins import RoleFixtureTestCase
 
+attendance_list = AttendanceViewSet.as_view({"get": "list"})
 
-class AttendancePermissionTests(RoleAPITestCase):
+
+class AttendancePermissionTests(AttendanceFixtureMixin, RoleFixtureTestCase):
     def test_employee_cannot_access_admin_attendance_list(self):
-        response = self.get("api_v1:attendance-list", role=ROLE_EMPLOYEE)
+        response = self.direct(
+            attendance_list, "get", "api_v1:attendance-list", role=ROLE_EMPLOYEE
+        )
         self.assert_denied(response)
 
     def test_manager_can_list_all_attendance_records(self):
-        response = self.get("api_v1:attendance-list", role=ROLE_MANAGER)
+        def list_as_manager():
+            return self.direct(
+                attendance_list, "get", "api_v1:attendance-list", role=ROLE_MANAGER
+            )
+
+        response = list_as_manager()
         self.assert_http_status(response, status.HTTP_200_OK)
-        employees = {row["employee"] for row in self.extract_results(response)}
-        assert self.roles[ROLE_EMPLOYEE].employee.pk in employees
+        employees = self.employee_ids(response)
+        assert self.employee_pk in employees
+
+        # Query budget: more rows must not mean more queries (no N+1).
+        baseline = self.count_queries(list_as_manager)
+        now = timezone.now()
+        Attendance.objects.bulk_create(
+            Attendance(
+                employee_id=self.employee_pk,
+                date=(now - timedelta(days=days)).date(),
+                clock_in=now - timedelta(days=days),
+            )
+            for days in (1, 2, 3)
+        )
+        assert self.count_queries(list_as_manager) == baseline
 
     def test_line_manager_only_sees_department_attendances(self):
         response = self.get("api_v1:attendance-list", role=ROLE_LINE_MANAGER)
         self.assert_http_status(response, status.HTTP_200_OK)
-        employees = {row["employee"] for row in self.extract_results(response)}
-        assert self.roles[ROLE_EMPLOYEE].employee.pk in employees
-        assert self.others["employee"].employee.pk not in employees
+        employees = self.employee_ids(response)
+        assert self.employee_pk in employees
+        assert self.other_employee_pk not in employees
 
     def test_line_manager_cannot_patch_team_attendance_times(self):
         team_record = self.attendance_records["team"]
@@ -58,10 +82,11 @@ class AttendancePermissionTests(RoleAPITestCase):
     def test_line_manager_cannot_delete_clock_out_to_reopen_attendance(self):
         team_record = self.attendance_records["team"]
         # Set an initial clock_out
-        team_record.clock_out = timezone.now() + timedelta(hours=8)
-        team_record.clock_out_location = "HQ"
-        team_record.save(
-            update_fields=["clock_out", "clock_out_location", "updated_at"]
+        now = timezone.now()
+        Attendance.objects.filter(pk=team_record.pk).update(
+            clock_out=now + timedelta(hours=8),
+            clock_out_location="HQ",
+            updated_at=now,
         )
 
         res = self.delete(
@@ -72,134 +97,60 @@ class AttendancePermissionTests(RoleAPITestCase):
         self.assert_denied(res)
 
     def test_manual_entry_records_authenticated_employee(self):
-        target_date = (timezone.now().date() + timedelta(days=7)).isoformat()
-        target_clock_in = (timezone.now() + timedelta(days=7)).isoformat()
-        payload = {
-            "date": target_date,
-            "clock_in": target_clock_in,
-            "clock_in_location": "HQ kiosk",
-        }
-        employee_id = self.roles[ROLE_EMPLOYEE].employee.pk
-        allowed = self.post(
-            "employee-attendance-manual-entry",
-            role=ROLE_EMPLOYEE,
-            payload=payload,
-            reverse_kwargs={"employee_id": employee_id},
-        )
-        self.assert_http_status(allowed, status.HTTP_201_CREATED)
-        assert allowed.data["employee"] == employee_id
-
-    def test_manual_entry_ignores_submitted_employee_id(self):
-        target_date = (timezone.now().date() + timedelta(days=8)).isoformat()
-        target_clock_in = (timezone.now() + timedelta(days=8)).isoformat()
-        payload = {
-            "employee": self.roles[ROLE_MANAGER].employee.pk,
-            "date": target_date,
-            "clock_in": target_clock_in,
-            "clock_in_location": "HQ kiosk",
-        }
-        employee_id = self.roles[ROLE_EMPLOYEE].employee.pk
-        allowed = self.post(
-            "employee-attendance-manual-entry",
-            role=ROLE_EMPLOYEE,
-            payload=payload,
-            reverse_kwargs={"employee_id": employee_id},
-        )
-        self.assert_http_status(allowed, status.HTTP_201_CREATED)
-        assert allowed.data["employee"] == employee_id
-
-    def test_clock_in_ignores_submitted_employee_id(self):
-        OfficeNetwork.objects.create(
-            label="Loopback", cidr="127.0.0.1/32", is_active=True
-        )
-        target_date = (timezone.now().date() + timedelta(days=9)).isoformat()
-        target_clock_in = (timezone.now() + timedelta(days=9)).isoformat()
-        payload = {
-            "employee": self.roles[ROLE_MANAGER].employee.pk,
-            "date": target_date,
-            "clock_in": target_clock_in,
-            "clock_in_location": "HQ kiosk",
-        }
-        employee_id = self.roles[ROLE_EMPLOYEE].employee.pk
-        allowed = self.post(
-            "employee-attendance-clock-in",
-            role=ROLE_EMPLOYEE,
-            payload=payload,
-            reverse_kwargs={"employee_id": employee_id},
-        )
-        self.assert_http_status(allowed, status.HTTP_201_CREATED)
-        assert allowed.data["employee"] == employee_id
+        # (days ahead, submitted employee id). Each case uses its own date, so
+        # the row created by the first case never collides with the second.
+        cases = [(7, None), (8, self.manager_pk)]
+        for days, submitted_employee in cases:
+            with self.subTest(employee=submitted_employee):
+                target = timezone.now() + timedelta(days=days)
+                payload = {
+                    "date": target.date().isoformat(),
+                    "clock_in": target.isoformat(),
+                    "clock_in_location": "HQ kiosk",
+                }
+                if submitted_employee is not None:
+                    payload["employee"] = submitted_employee
+                allowed = self.post(
+                    "employee-attendance-manual-entry",
+                    role=ROLE_EMPLOYEE,
+                    payload=payload,
+                    reverse_kwargs={"employee_id": self.employee_pk},
+                )
+                self.assert_http_status(allowed, status.HTTP_201_CREATED)
+                assert allowed.data["employee"] == self.employee_pk
 
     def test_attendance_today_returns_structure_without_records(self):
         future_date = (timezone.now().date() + timedelta(days=5)).isoformat()
-        self.authenticate(ROLE_EMPLOYEE)
-        url = (
-            f"{reverse('employee-attendance-today', kwargs={'employee_id': self.roles[ROLE_EMPLOYEE].employee.pk})}"  # noqa: E501
-            f"?date={future_date}"
+        response = self.get(
+            "employee-attendance-today",
+            role=ROLE_EMPLOYEE,
+            reverse_kwargs={"employee_id": self.employee_pk},
+            data={"date": future_date},
         )
-        response = self.client.get(url)
         self.assert_http_status(response, status.HTTP_200_OK)
         assert response.data["punches"] == []
         assert response.data["attendance_id"] is None
 
     def test_attendance_today_includes_existing_clock_in(self):
-        self.authenticate(ROLE_EMPLOYEE)
-        response = self.client.get(
-            reverse(
-                "employee-attendance-today",
-                kwargs={"employee_id": self.roles[ROLE_EMPLOYEE].employee.pk},
-            )
+        response = self.get(
+            "employee-attendance-today",
+            role=ROLE_EMPLOYEE,
+            reverse_kwargs={"employee_id": self.employee_pk},
         )
         self.assert_http_status(response, status.HTTP_200_OK)
-        assert len(response.data["punches"]) == 1
-        assert response.data["punches"][0]["type"] == "check_in"
+        punches = response.data["punches"]
+        assert len(punches) == 1
+        assert punches[0]["type"] == "check_in"
 
     def test_attendance_actions_endpoint_lists_available_routes(self):
         allowed = self.get(
             "employee-attendance-actions",
             role=ROLE_EMPLOYEE,
-            reverse_kwargs={"employee_id": self.roles[ROLE_EMPLOYEE].employee.pk},
+            reverse_kwargs={"employee_id": self.employee_pk},
         )
         self.assert_http_status(allowed, status.HTTP_200_OK)
         assert any(a["name"] == "today" for a in allowed.data["actions"])
 
-    def test_attendance_check_requires_office_network(self):
-        target_date = (timezone.now().date() + timedelta(days=6)).isoformat()
-        payload = {
-            "action": "check_in",
-            "location": "HQ kiosk",
-            "date": target_date,
-            "time": "08:05",
-        }
-        denied = self.post(
-            "employee-attendance-check",
-            role=ROLE_EMPLOYEE,
-            payload=payload,
-            reverse_kwargs={"employee_id": self.roles[ROLE_EMPLOYEE].employee.pk},
-        )
-        self.assert_denied(denied, code=status.HTTP_403_FORBIDDEN)
-
-    def test_attendance_check_creates_clock_in_with_network(self):
-        OfficeNetwork.objects.create(
-            label="Loopback", cidr="127.0.0.1/32", is_active=True
-        )
-        target_date = (timezone.now().date() + timedelta(days=7)).isoformat()
-        payload = {
-            "action": "check_in",
-            "location": "HQ kiosk",
-            "date": target_date,
-            "time": "08:10",
-        }
-        allowed = self.post(
-            "employee-attendance-check",
-            role=ROLE_EMPLOYEE,
-            payload=payload,
-            reverse_kwargs={"employee_id": self.roles[ROLE_EMPLOYEE].employee.pk},
-        )
-        self.assert_http_status(allowed, status.HTTP_201_CREATED)
-        assert len(allowed.data["punches"]) == 1
-        assert allowed.data["punches"][0]["type"] == "check_in"
-
     def test_attendance_check_closes_open_record(self):
         payload = {
             "action": "check_out",
@@ -210,7 +161,7 @@ class AttendancePermissionTests(RoleAPITestCase):
             "employee-attendance-check",
             role=ROLE_EMPLOYEE,
             payload=payload,
-            reverse_kwargs={"employee_id": self.roles[ROLE_EMPLOYEE].employee.pk},
+            reverse_kwargs={"employee_id": self.employee_pk},
         )
         self.assert_http_status(allowed, status.HTTP_200_OK)
         assert len(allowed.data["punches"]) == 2
@@ -237,7 +188,7 @@ class AttendancePermissionTests(RoleAPITestCase):
         )
 
 
-class AttendanceDepartmentListTests(RoleAPITestCase):
+class AttendanceDepartmentListTests(AttendanceFixtureMixin, RoleFixtureTestCase):
     def test_manager_sees_departments_summary_with_counts(self):
         response = self.get("api_v1:attendance-departments-summary", role=ROLE_MANAGER)
         self.assert_http_status(response, status.HTTP_200_OK)
@@ -292,12 +243,48 @@ class AttendanceDepartmentListTests(RoleAPITestCase):
         assert "ABSENT" in statuses
 
 
-class AttendancePunchSecurityTests(RoleAPITestCase):
-    def test_employee_cannot_clock_in_for_another_employee_by_url_tweaking(self):
-        OfficeNetwork.objects.create(
-            label="Loopback", cidr="127.0.0.1/32", is_active=True
+class AttendanceOfficeNetworkPunchTests(
+    OfficeNetworkFixtureMixin, AttendanceFixtureMixin, RoleFixtureTestCase
+):
+    """Loopback is an office network here, so self check-in is allowed."""
+
+    def test_clock_in_ignores_submitted_employee_id(self):
+        target = timezone.now() + timedelta(days=9)
+        payload = {
+            "date": target.date().isoformat(),
+            "clock_in": target.isoformat(),
+            "clock_in_location": "HQ kiosk",
+            "employee": self.manager_pk,
+        }
+        allowed = self.post(
+            "employee-attendance-clock-in",
+            role=ROLE_EMPLOYEE,
+            payload=payload,
+            reverse_kwargs={"employee_id": self.employee_pk},
+        )
+        self.assert_http_status(allowed, status.HTTP_201_CREATED)
+        assert allowed.data["employee"] == self.employee_pk
+
+    def test_attendance_check_creates_clock_in_with_network(self):
+        target_date = (timezone.now().date() + timedelta(days=7)).isoformat()
+        payload = {
+            "action": "check_in",
+            "location": "HQ kiosk",
+            "date": target_date,
+            "time": "08:10",
+        }
+        allowed = self.post(
+            "employee-attendance-check",
+            role=ROLE_EMPLOYEE,
+            payload=payload,
+            reverse_kwargs={"employee_id": self.employee_pk},
         )
-        other_emp_id = self.others["employee"].employee.pk
+        self.assert_http_status(allowed, status.HTTP_201_CREATED)
+        assert len(allowed.data["punches"]) == 1
+        assert allowed.data["punches"][0]["type"] == "check_in"
+
+    def test_employee_cannot_clock_in_for_another_employee_by_url_tweaking(self):
+        other_emp_id = self.other_employee_pk
         payload = {"clock_in_location": "HQ kiosk"}
         denied = self.post(
             "employee-attendance-clock-in",
@@ -306,3 +293,23 @@ class AttendancePunchSecurityTests(RoleAPITestCase):
             reverse_kwargs={"employee_id": other_emp_id},
         )
         self.assert_denied(denied)
+
+
+class AttendanceOfficeNetworkPolicyTests(AttendanceFixtureMixin, RoleFixtureTestCase):
+    """No OfficeNetwork rows exist here, so self check-in is refused."""
+
+    def test_attendance_check_requires_office_network(self):
+        target_date = (timezone.now().date() + timedelta(days=6)).isoformat()
+        payload = {
+            "action": "check_in",
+            "location": "HQ kiosk",
+            "date": target_date,
+            "time": "08:05",
+        }
+        denied = self.post(
+            "employee-attendance-check",
+            role=ROLE_EMPLOYEE,
+            payload=payload,
+            reverse_kwargs={"employee_id": self.employee_pk},
+        )
+        self.assert_denied(denied, code=status.HTTP_403_FORBIDDEN)
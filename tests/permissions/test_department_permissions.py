@@ -1,5 +1,6 @@
 from rest_framework import status
 
+from hr_payroll.org.models import Department
 from tests.permissions.mixins import ROLE_EMPLOYEE
 from tests.permissions.mixins import ROLE_MANAGER
 from tests.permissions.mixins import RoleAPITestCase
@@ -23,7 +24,7 @@ class DepartmentPermissionTests(RoleAPITestCase):
 
     def test_assign_manager_requires_elevated_role(self):
         department = self.departments["remote"]
-        target_employee_id = self.roles[ROLE_EMPLOYEE].employee.id
+        target_employee_id = self.employee_pk
         denied = self.post(
             "api_v1:department-assign-manager",
             role=ROLE_EMPLOYEE,
@@ -38,5 +39,8 @@ class DepartmentPermissionTests(RoleAPITestCase):
             reverse_kwargs={"pk": department.pk},
         )
         self.assert_http_status(allowed, status.HTTP_200_OK)
-        department.refresh_from_db()
-        assert department.manager_id == target_employee_id
+        # The response serializer omits the manager, so read just that column.
+        manager_id = Department.objects.values_list("manager_id", flat=True).get(
+            pk=department.pk
+        )
+        assert manager_id == target_employee_id
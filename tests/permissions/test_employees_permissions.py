@@ -1,6 +1,5 @@
 from rest_framework import status
 
-from hr_payroll.employees.models import Employee
 from tests.permissions.mixins import ROLE_EMPLOYEE
 from tests.permissions.mixins import ROLE_MANAGER
 from tests.permissions.mixins import ROLE_PAYROLL
@@ -11,19 +10,16 @@ class EmployeeDirectoryPermissionTests(RoleAPITestCase):
     def test_payroll_role_sees_every_employee(self):
         response = self.get("api_v1:employees-list", role=ROLE_PAYROLL)
         self.assert_http_status(response, status.HTTP_200_OK)
-        assert len(self.extract_results(response)) == Employee.objects.count()
+        assert len(self.extract_results(response)) == self.expected_employee_count
 
     def test_regular_employee_scoped_to_self(self):
         response = self.get("api_v1:employees-list", role=ROLE_EMPLOYEE)
         results = self.extract_results(response)
         assert len(results) == 1
-        assert (
-            results[0]["general"]["emailaddress"]
-            == self.roles[ROLE_EMPLOYEE].user.email
-        )
+        assert results[0]["general"]["emailaddress"] == self.employee_email
 
     def test_regular_employee_can_only_retrieve_self(self):
-        my_employee_id = self.roles[ROLE_EMPLOYEE].employee.pk
+        my_employee_id = self.employee_pk
         allowed = self.get(
             "api_v1:employees-detail",
             role=ROLE_EMPLOYEE,
@@ -31,7 +27,7 @@ class EmployeeDirectoryPermissionTests(RoleAPITestCase):
         )
         self.assert_http_status(allowed, status.HTTP_200_OK)
 
-        other_employee_id = self.others["employee"].employee.pk
+        other_employee_id = self.other_employee_pk
         denied = self.get(
             "api_v1:employees-detail",
             role=ROLE_EMPLOYEE,
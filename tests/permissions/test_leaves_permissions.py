@@ -1,34 +1,57 @@
+from datetime import timedelta
+
 from django.utils import timezone
 from rest_framework import status
 
+from hr_payroll.leaves.models import LeaveRequest
 from tests.permissions.mixins import ROLE_EMPLOYEE
 from tests.permissions.mixins import ROLE_LINE_MANAGER
 from tests.permissions.mixins import ROLE_MANAGER
-from tests.permissions.mixins import RoleAPITestCase
+from tests.permissions.mixins import LeaveFixtureMixin
+from tests.permissions.mixins import RoleFixtureTestCase
 
 
-class LeavePermissionTests(RoleAPITestCase):
+class LeavePermissionTests(LeaveFixtureMixin, RoleFixtureTestCase):
     def test_manager_sees_all_leave_requests(self):
-        response = self.get("api_v1:leave-request-list", role=ROLE_MANAGER)
+        def list_as_manager():
+            return self.get("api_v1:leave-request-list", role=ROLE_MANAGER)
+
+        response = list_as_manager()
         self.assert_http_status(response, status.HTTP_200_OK)
-        employees = {row["employee"] for row in self.extract_results(response)}
+        employees = self.employee_ids(response)
         assert employees == {
-            self.roles[ROLE_EMPLOYEE].employee.id,
-            self.others["employee"].employee.id,
+            self.employee_pk,
+            self.other_employee_pk,
         }
 
+        # Query budget: more rows must not mean more queries (no N+1).
+        baseline = self.count_queries(list_as_manager)
+        start = timezone.now().date() + timedelta(days=30)
+        LeaveRequest.objects.bulk_create(
+            LeaveRequest(
+                employee_id=employee_id,
+                policy=self.leave_policy,
+                start_date=start,
+                end_date=start,
+                duration=1,
+            )
+            for employee_id in (self.employee_pk, self.other_employee_pk)
+        )
+        assert self.count_queries(list_as_manager) == baseline
+
     def test_line_manager_only_sees_team_requests(self):
         response = self.get("api_v1:leave-request-list", role=ROLE_LINE_MANAGER)
         self.assert_http_status(response, status.HTTP_200_OK)
-        employees = {row["employee"] for row in self.extract_results(response)}
-        assert self.roles[ROLE_EMPLOYEE].employee.id in employees
-        assert self.others["employee"].employee.id not in employees
+        employees = self.employee_ids(response)
+        assert self.employee_pk in employees
+        assert self.other_employee_pk not in employees
 
     def test_employee_can_submit_own_leave_request(self):
+        today = timezone.now().date().isoformat()
         payload = {
             "policy": self.leave_policy.id,
-            "start_date": timezone.now().date().isoformat(),
-            "end_date": timezone.now().date().isoformat(),
+            "start_date": today,
+            "end_date": today,
             "duration": 1,
         }
         response = self.post(
@@ -37,4 +60,4 @@ class LeavePermissionTests(RoleAPITestCase):
             payload=payload,
         )
         self.assert_http_status(response, status.HTTP_201_CREATED)
-        assert response.data["employee"] == self.roles[ROLE_EMPLOYEE].employee.id
+        assert response.data["employee"] == self.employee_pk
@@ -10,11 +10,20 @@ class PayrollPermissionTests(RoleAPITestCase):
     def test_only_payroll_and_admin_roles_can_access_payroll_endpoints(self):
         denied = self.get("api_v1:bank-master-list", role=ROLE_MANAGER)
         self.assert_denied(denied)
-        allowed = self.get("api_v1:bank-master-list", role=ROLE_PAYROLL)
+
+        def list_as_payroll():
+            return self.get("api_v1:bank-master-list", role=ROLE_PAYROLL)
+
+        allowed = list_as_payroll()
         self.assert_http_status(allowed, status.HTTP_200_OK)
         names = {row["name"] for row in self.extract_results(allowed)}
         assert self.bank_master.name in names
 
+        # Query budget: more rows must not mean more queries (no N+1).
+        baseline = self.count_queries(list_as_payroll)
+        BankMaster.objects.bulk_create(BankMaster(name=f"Bank {c}") for c in "XYZ")
+        assert self.count_queries(list_as_payroll) == baseline
+
     def test_payroll_role_can_create_bank_records(self):
         payload = {"name": "Bank B"}
         response = self.post(
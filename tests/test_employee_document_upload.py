@@ -6,9 +6,22 @@ from hr_payroll.employees.models import Employee
 from hr_payroll.users.models import User
 
 
-@pytest.mark.django_db
+@pytest.fixture
+def doc_client(db, settings, tmp_path):
+    """An authenticated client plus the employee it uploads documents for."""
+    # Ensure uploads always write to a writable location (CI containers may not
+    # have permissions for the default /app/hr_payroll/media).
+    settings.MEDIA_ROOT = str(tmp_path / "media")
+    # The client is force-authenticated, so the user needs no password hash.
+    user = User.objects.create_user(username="docuser", email="docuser@example.com")
+    employee = Employee.objects.create(user=user, employee_id="E-DOCTEST", title="Eng")
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, employee
+
+
 def test_employee_upload_document_multipart_tempfile_no_deepcopy_error(
-    settings, tmp_path
+    doc_client, settings
 ):
     """Uploading via multipart should not crash with deepcopy/pickle errors.
 
@@ -18,22 +31,9 @@ def test_employee_upload_document_multipart_tempfile_no_deepcopy_error(
     TypeError: cannot pickle 'BufferedRandom' instances
     """
 
-    # Ensure uploads always write to a writable location (CI containers may not
-    # have permissions for the default /app/hr_payroll/media).
-    settings.MEDIA_ROOT = str(tmp_path / "media")
-
+    client, employee = doc_client
     settings.FILE_UPLOAD_MAX_MEMORY_SIZE = 1  # force temp-file uploads
 
-    user = User.objects.create_user(
-        username="docuser",
-        email="docuser@example.com",
-        password="testpass123",  # noqa: S106
-    )
-    employee = Employee.objects.create(user=user, employee_id="E-DOCTEST", title="Eng")
-
-    client = APIClient()
-    client.force_authenticate(user=user)
-
     upload = SimpleUploadedFile(
         "big.pdf",
         b"x" * 2048,
@@ -52,20 +52,8 @@ def test_employee_upload_document_multipart_tempfile_no_deepcopy_error(
     assert res.data.get("employee") in (employee.pk, str(employee.pk))
 
 
-@pytest.mark.django_db
-def test_employee_upload_document_accepts_frontend_alias_fields(settings, tmp_path):
-    settings.MEDIA_ROOT = str(tmp_path / "media")
-    settings.FILE_UPLOAD_MAX_MEMORY_SIZE = 1  # force temp-file uploads
-
-    user = User.objects.create_user(
-        username="docuser2",
-        email="docuser2@example.com",
-        password="testpass123",  # noqa: S106
-    )
-    employee = Employee.objects.create(user=user, employee_id="E-DOCTEST2", title="Eng")
-
-    client = APIClient()
-    client.force_authenticate(user=user)
+def test_employee_upload_document_accepts_frontend_alias_fields(doc_client):
+    client, employee = doc_client
 
     upload = SimpleUploadedFile(
         "alias.pdf",
@@ -83,18 +71,8 @@ def test_employee_upload_document_accepts_frontend_alias_fields(settings, tmp_pa
     assert res.data["name"] == "Passport"
 
 
-@pytest.mark.django_db
-def test_employee_upload_document_missing_file_returns_clear_400(settings, tmp_path):
-    settings.MEDIA_ROOT = str(tmp_path / "media")
-    user = User.objects.create_user(
-        username="docuser3",
-        email="docuser3@example.com",
-        password="testpass123",  # noqa: S106
-    )
-    employee = Employee.objects.create(user=user, employee_id="E-DOCTEST3", title="Eng")
-
-    client = APIClient()
-    client.force_authenticate(user=user)
+def test_employee_upload_document_missing_file_returns_clear_400(doc_client):
+    client, employee = doc_client
 
     res = client.post(
         f"/api/v1/employees/{employee.pk}/upload-document/",
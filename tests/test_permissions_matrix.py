@@ -7,8 +7,11 @@ from django.contrib.auth.models import Group
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
+from rest_framework.test import APIRequestFactory
 from rest_framework.test import APITestCase
+from rest_framework.test import force_authenticate
 
+from hr_payroll.attendance.api.views import AttendanceViewSet
 from hr_payroll.attendance.models import Attendance
 from hr_payroll.employees.models import Employee
 from hr_payroll.leaves.models import LeavePolicy
@@ -24,47 +27,69 @@ TEST_PASSWORD = "TestPass123!"  # noqa: S105 - test credentials only
 class PermissionMatrixAPITests(APITestCase):
     """Validate the most important role-based permission flows."""
 
-    def setUp(self):
-        self.user_model = get_user_model()
+    @classmethod
+    def setUpTestData(cls):
+        # Built once per class; each test runs in its own rolled-back
+        # transaction and gets a fresh copy of these attributes.
+        cls.user_model = get_user_model()
         for name in RBAC_GROUPS:
             Group.objects.get_or_create(name=name)
-        self.dept_hq = Department.objects.create(name="HQ")
-        self.dept_remote = Department.objects.create(name="Remote")
-        self.admin_user, self.admin_employee = self._create_user(
+        cls.groups = {g.name: g for g in Group.objects.filter(name__in=RBAC_GROUPS)}
+        cls.dept_hq = Department.objects.create(name="HQ")
+        cls.dept_remote = Department.objects.create(name="Remote")
+        cls.admin_user, cls.admin_employee = cls._create_user(
             "admin",
             is_staff=True,
             groups=["Admin"],
         )
-        self.manager_user, self.manager_employee = self._create_user(
+        cls.manager_user, cls.manager_employee = cls._create_user(
             "manager",
             groups=["Manager"],
         )
-        self.dept_remote.manager = self.manager_employee
-        self.dept_remote.save(update_fields=["manager", "updated_at"])
-        self.payroll_user, self.payroll_employee = self._create_user(
+        # Plain UPDATE; keep the in-memory instance in step without a reload.
+        cls.dept_remote.manager = cls.manager_employee
+        Department.objects.filter(pk=cls.dept_remote.pk).update(
+            manager=cls.manager_employee, updated_at=timezone.now()
+        )
+        cls.payroll_user, cls.payroll_employee = cls._create_user(
             "payroll",
             groups=["Payroll"],
         )
-        self.line_manager_user, self.line_manager_employee = self._create_user(
+        cls.line_manager_user, cls.line_manager_employee = cls._create_user(
             "linemgr",
             groups=["Line Manager"],
         )
-        self.employee_user, self.employee_employee = self._create_user(
+        cls.employee_user, cls.employee_employee = cls._create_user(
             "employee",
-            line_manager=self.line_manager_employee,
+            line_manager=cls.line_manager_employee,
         )
-        self.other_employee_user, self.other_employee_employee = self._create_user(
+        cls.other_employee_user, cls.other_employee_employee = cls._create_user(
             "other",
-            department=self.dept_remote,
-        )
-        self.bank = BankMaster.objects.create(name="Bank A")
-        self.leave_type = LeaveType.objects.create(
+            department=cls.dept_remote,
+        )
+        cls.expected_employee_count = Employee.objects.count()
+        # Every route these tests hit, reversed once for the class.
+        employee_kwargs = {"employee_id": cls.employee_employee.pk}
+        cls.urls = {
+            "employee_attendance": reverse(
+                "employee-attendance-list", kwargs=employee_kwargs
+            ),
+            "attendance_list": reverse("api_v1:attendance-list"),
+            "manual_entry": reverse(
+                "employee-attendance-manual-entry", kwargs=employee_kwargs
+            ),
+            "department_list": reverse("api_v1:department-list"),
+        }
+        cls.bank = BankMaster.objects.create(name="Bank A")
+        now = timezone.now()
+        today = now.date()
+        cls.leave_type = LeaveType.objects.create(
             name="Annual",
             color_code="#00FF00",
             description="Annual leave",
         )
-        self.leave_policy = LeavePolicy.objects.create(
-            leave_type=self.leave_type,
+        cls.leave_policy = LeavePolicy.objects.create(
+            leave_type=cls.leave_type,
             name="Annual Policy",
             description="Base policy",
             entitlement=10,
@@ -72,36 +97,41 @@ class PermissionMatrixAPITests(APITestCase):
             carry_over_expire_month=12,
             carry_over_expire_day=31,
         )
-        self.leave_direct = LeaveRequest.objects.create(
-            employee=self.employee_employee,
-            policy=self.leave_policy,
-            start_date=timezone.now().date(),
-            end_date=timezone.now().date(),
-            duration=1,
-        )
-        self.leave_other = LeaveRequest.objects.create(
-            employee=self.other_employee_employee,
-            policy=self.leave_policy,
-            start_date=timezone.now().date(),
-            end_date=timezone.now().date(),
-            duration=1,
-        )
-        self.attendance_self = Attendance.objects.create(
-            employee=self.employee_employee,
-            date=timezone.now().date(),
-            clock_in=timezone.now(),
-            clock_in_location="HQ kiosk",
-        )
-        self.attendance_other = Attendance.objects.create(
-            employee=self.other_employee_employee,
-            date=timezone.now().date(),
-            clock_in=timezone.now(),
-            clock_in_location="Remote kiosk",
+        # bulk_create skips the leave-request notification signal; none of
+        # these tests look at notifications.
+        cls.leave_direct, cls.leave_other = LeaveRequest.objects.bulk_create(
+            [
+                LeaveRequest(
+                    employee=employee,
+                    policy=cls.leave_policy,
+                    start_date=today,
+                    end_date=today,
+                    duration=1,
+                )
+                for employee in (cls.employee_employee, cls.other_employee_employee)
+            ]
+        )
+        cls.attendance_self, cls.attendance_other = Attendance.objects.bulk_create(
+            [
+                Attendance(
+                    employee=cls.employee_employee,
+                    date=today,
+                    clock_in=now,
+                    clock_in_location="HQ kiosk",
+                ),
+                Attendance(
+                    employee=cls.other_employee_employee,
+                    date=today,
+                    clock_in=now,
+                    clock_in_location="Remote kiosk",
+                ),
+            ]
         )
 
     # Helpers -----------------------------------------------------------------
+    @classmethod
     def _create_user(
-        self,
+        cls,
         username,
         *,
         groups=None,
@@ -109,7 +139,7 @@ class PermissionMatrixAPITests(APITestCase):
         department=None,
         line_manager=None,
     ):
-        user = self.user_model.objects.create_user(
+        user = cls.user_model.objects.create_user(
             username=username,
             email=f"{username}@example.com",
             password=TEST_PASSWORD,
@@ -117,11 +147,11 @@ class PermissionMatrixAPITests(APITestCase):
         if is_staff:
             user.is_staff = True
             user.save(update_fields=["is_staff"])
-        for group_name in groups or []:
-            user.groups.add(Group.objects.get(name=group_name))
+        if groups:
+            user.groups.add(*(cls.groups[name] for name in groups))
         employee = Employee.objects.create(
             user=user,
-            department=department or self.dept_hq,
+            department=department or cls.dept_hq,
             line_manager=line_manager,
             is_active=True,
         )
@@ -129,16 +159,13 @@ class PermissionMatrixAPITests(APITestCase):
 
     def _extract_results(self, response):
         data = response.data
-        if isinstance(data, dict) and "results" in data:
-            return data["results"]
+        if isinstance(data, dict):
+            return data.get("results", [])
         return data if isinstance(data, list) else []
 
     # Tests --------------------------------------------------------------------
     def test_regular_employee_sees_only_their_attendance_records(self):
-        url = reverse(
-            "employee-attendance-list",
-            kwargs={"employee_id": self.employee_employee.pk},
-        )
+        url = self.urls["employee_attendance"]
         self.client.force_authenticate(user=self.employee_user)
         resp = self.client.get(url)
         assert resp.status_code == status.HTTP_200_OK
@@ -146,18 +173,17 @@ class PermissionMatrixAPITests(APITestCase):
         assert employees == {self.employee_employee.pk}
 
     def test_admin_attendance_list_blocked_for_regular_employee(self):
-        url = reverse("api_v1:attendance-list")
-        self.client.force_authenticate(user=self.employee_user)
-        resp = self.client.get(url)
+        # Permission check only: call the view without middleware or routing.
+        request = APIRequestFactory().get(self.urls["attendance_list"])
+        force_authenticate(request, user=self.employee_user)
+        resp = AttendanceViewSet.as_view({"get": "list"})(request)
         assert resp.status_code == status.HTTP_403_FORBIDDEN
 
     def test_manual_entry_uses_authenticated_user_profile(self):
-        url = reverse(
-            "employee-attendance-manual-entry",
-            kwargs={"employee_id": self.employee_employee.pk},
-        )
-        target_date = (timezone.now().date() + timedelta(days=7)).isoformat()
-        target_clock_in = (timezone.now() + timedelta(days=7)).isoformat()
+        url = self.urls["manual_entry"]
+        target = timezone.now() + timedelta(days=7)
+        target_date = target.date().isoformat()
+        target_clock_in = target.isoformat()
         payload = {
             "employee": self.manager_employee.pk,
             "date": target_date,
@@ -181,11 +207,10 @@ class PermissionMatrixAPITests(APITestCase):
         assert self.bank.name in names
 
     def test_payroll_role_can_view_full_employee_directory(self):
-        total_employees = Employee.objects.count()
         self.client.force_authenticate(user=self.payroll_user)
         resp = self.client.get("/api/v1/employees/")
         assert resp.status_code == status.HTTP_200_OK
-        assert len(self._extract_results(resp)) == total_employees
+        assert len(self._extract_results(resp)) == self.expected_employee_count
         self.client.force_authenticate(user=self.employee_user)
         scoped = self.client.get("/api/v1/employees/")
         assert len(self._extract_results(scoped)) == 1
@@ -200,7 +225,7 @@ class PermissionMatrixAPITests(APITestCase):
         assert self.other_employee_employee.pk not in employees
 
     def test_department_management_locked_to_admin_and_managers(self):
-        url = reverse("api_v1:department-list")
+        url = self.urls["department_list"]
         payload = {"name": "New Dept"}
         self.client.force_authenticate(user=self.employee_user)
         denied = self.client.post(url, payload, format="json")
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
+from django.db.models import Case
+from django.db.models import DateTimeField
+from django.db.models import Value
+from django.db.models import When
 from django.utils import timezone
 
 from hr_payroll.audit.models import AuditLog
@@ -19,15 +25,21 @@ class TestRecentAuditEndpoint(RoleAPITestCase):
 
     def test_recent_audit_returns_latest_5(self):
         # Create 6 logs with deterministic timestamps so ordering is stable.
+        # auto_now_add overrides created_at on insert, so one INSERT for the
+        # rows and one CASE UPDATE to spread their timestamps.
         base = timezone.now()
-        created = []
-        for i in range(6):
-            row = AuditLog.objects.create(action=f"test_action_{i}", message=str(i))
-            created.append(row)
-        for i, row in enumerate(created):
-            AuditLog.objects.filter(pk=row.pk).update(
-                created_at=base + timezone.timedelta(seconds=i)
+        created = AuditLog.objects.bulk_create(
+            [AuditLog(action=f"test_action_{i}", message=str(i)) for i in range(6)]
+        )
+        AuditLog.objects.filter(pk__in=[row.pk for row in created]).update(
+            created_at=Case(
+                *(
+                    When(pk=row.pk, then=Value(base + timedelta(seconds=i)))
+                    for i, row in enumerate(created)
+                ),
+                output_field=DateTimeField(),
             )
+        )
 
         res = self.get("api_v1:audit:recent", role=ROLE_LINE_MANAGER)
         self.assert_http_status(res, 200)